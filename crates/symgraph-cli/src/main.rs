@@ -171,8 +171,12 @@ fn main() -> Result<()> {
             start_web_viewer(&db)?;
         }
         
-        Command::Api { endpoint, db, search } => {
-            handle_api_request(&endpoint, &db, search.as_deref())?;
+        Command::Api { endpoint, db, search, after, limit } => {
+            handle_api_request(&endpoint, &db, search.as_deref(), after.as_deref(), limit)?;
+        }
+        
+        Command::ApiServe => {
+            api_serve()?;
         }
     }
 
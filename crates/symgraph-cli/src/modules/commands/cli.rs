@@ -177,7 +177,7 @@ pub enum Command {
 
     /// API endpoint for web viewer (internal use).
     Api {
-        /// API endpoint (stats, files, symbols)
+        /// API endpoint (stats, files, file-table, symbols, overview)
         endpoint: String,
 
         /// Database file path
@@ -187,7 +187,19 @@ pub enum Command {
         /// Search query (optional)
         #[arg(short, long)]
         search: Option<String>,
+
+        /// Return symbols after this symbol ID (next page)
+        #[arg(long)]
+        after: Option<String>,
+
+        /// Maximum number of symbols to return
+        #[arg(long)]
+        limit: Option<usize>,
     },
+
+    /// Answer `api` requests read from stdin, one JSON object per line,
+    /// keeping the database open between them (internal use).
+    ApiServe,
 }
 
 /// Command line arguments
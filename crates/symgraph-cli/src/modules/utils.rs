@@ -292,21 +292,13 @@ pub fn list_modules(db_path: &str) -> Result<()> {
 pub fn show_stats(db_path: &str) -> Result<()> {
     let db = symgraph_core::Db::open(db_path)?;
 
-    let file_count = db.db.scan_prefix("file:").count();
-    let symbol_count = db.db.scan_prefix("symbol:").count();
+    // Files, symbols and edges come from the counters kept while indexing
+    // (which also count each file once, not under both its path and id)
+    let stats = db.get_stats()?;
     let occurrence_count = db.db.scan_prefix("occurrence:").count();
-    let edge_count = db.db.scan_prefix("edge:").count();
     let module_count = db.db.scan_prefix("module:").count();
 
-    println!("=== Database Statistics ===");
-    println!("Files:       {}", file_count);
-    println!("Symbols:     {}", symbol_count);
-    println!("Occurrences: {}", occurrence_count);
-    println!("Edges:       {}", edge_count);
-    println!("Modules:     {}", module_count);
-
-    // Symbol breakdown
-    println!("\n=== Symbol Types ===");
+    // Symbol breakdown: the only pass over the symbols
     let mut symbol_types: std::collections::HashMap<String, usize> = std::collections::HashMap::new();
     for item in db.db.scan_prefix("symbol:") {
         let (_, value): (_, sled::IVec) = item?;
@@ -314,6 +306,15 @@ pub fn show_stats(db_path: &str) -> Result<()> {
             *symbol_types.entry(symbol.kind).or_insert(0) += 1;
         }
     }
+
+    println!("=== Database Statistics ===");
+    println!("Files:       {}", stats.files);
+    println!("Symbols:     {}", stats.symbols);
+    println!("Occurrences: {}", occurrence_count);
+    println!("Edges:       {}", stats.edges);
+    println!("Modules:     {}", module_count);
+
+    println!("\n=== Symbol Types ===");
     
     let mut sorted_types: Vec<_> = symbol_types.iter().collect();
     sorted_types.sort_by(|a, b| b.1.cmp(a.1));
@@ -708,20 +709,108 @@ if __name__ == '__main__':
 }
 
 /// Handle API requests from web viewer.
-pub fn handle_api_request(endpoint: &str, db_path: &str, search: Option<&str>) -> Result<()> {
+pub fn handle_api_request(
+    endpoint: &str,
+    db_path: &str,
+    search: Option<&str>,
+    after: Option<&str>,
+    limit: Option<usize>,
+) -> Result<()> {
     use symgraph_core::SymgraphDb;
-    use serde_json::json;
+    use std::io::{BufWriter, Write};
+    
+    let db = SymgraphDb::open_for_reading(db_path)?;
     
-    let db = SymgraphDb::open(db_path)?;
+    // Serialize straight into buffered stdout: no intermediate Value tree
+    // and no String holding the whole response
+    let mut out = BufWriter::new(std::io::stdout().lock());
+    write_api_response(&db, &mut out, endpoint, search, after, limit)?;
     
-    let response = match endpoint {
+    writeln!(out)?;
+    out.flush()?;
+    Ok(())
+}
+
+/// Answer API requests read from stdin until it is closed.
+///
+/// Each request is one line holding a JSON object with the fields of the
+/// `api` command: `endpoint`, `db` and optionally `search`, `after` and
+/// `limit`. Each answer is two lines: `ok` followed by the response body,
+/// or `error` followed by the message as a JSON string. The database stays
+/// open between requests and is only reopened when `db` changes.
+pub fn api_serve() -> Result<()> {
+    use symgraph_core::SymgraphDb;
+    use std::io::{BufRead, BufWriter, Write};
+    
+    let stdin = std::io::stdin();
+    let mut out = BufWriter::new(std::io::stdout().lock());
+    let mut open_db: Option<(String, SymgraphDb)> = None;
+    let mut body = Vec::new();
+    
+    for line in stdin.lock().lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+        
+        body.clear();
+        let result = (|| -> Result<()> {
+            let request: serde_json::Value = serde_json::from_str(&line)?;
+            let field = |name: &str| request.get(name).and_then(|v| v.as_str());
+            let endpoint = field("endpoint")
+                .ok_or_else(|| anyhow::anyhow!("Request has no endpoint"))?;
+            let db_path = field("db")
+                .ok_or_else(|| anyhow::anyhow!("Request has no db"))?;
+            let limit = request.get("limit").and_then(|v| v.as_u64()).map(|n| n as usize);
+            
+            if open_db.as_ref().map_or(true, |(path, _)| path != db_path) {
+                // Drop the previous database first so its lock is released
+                drop(open_db.take());
+                open_db = Some((db_path.to_string(), SymgraphDb::open_for_reading(db_path)?));
+            }
+            let db = &open_db.as_ref().unwrap().1;
+            write_api_response(db, &mut body, endpoint, field("search"), field("after"), limit)
+        })();
+        
+        match result {
+            Ok(()) => {
+                out.write_all(b"ok\n")?;
+                out.write_all(&body)?;
+            }
+            Err(e) => {
+                out.write_all(b"error\n")?;
+                serde_json::to_writer(&mut out, &e.to_string())?;
+            }
+        }
+        writeln!(out)?;
+        out.flush()?;
+    }
+    Ok(())
+}
+
+/// Write the response body for one API endpoint, without a trailing newline.
+fn write_api_response<W: std::io::Write>(
+    db: &symgraph_core::SymgraphDb,
+    mut out: W,
+    endpoint: &str,
+    search: Option<&str>,
+    after: Option<&str>,
+    limit: Option<usize>,
+) -> Result<()> {
+    match endpoint {
         "stats" => {
+            serde_json::to_writer(&mut out, &db.get_stats()?)?;
+        }
+        "overview" => {
+            // Stats and the file list in one call, so the GUI needs a
+            // single process (and database open) to fill the viewer tab
             let stats = db.get_stats()?;
-            json!({
-                "files": stats.files,
-                "symbols": stats.symbols,
-                "edges": stats.edges
-            })
+            let files = db.list_files()?;
+            out.write_all(b"{\"stats\":")?;
+            serde_json::to_writer(&mut out, &stats)?;
+            out.write_all(b",\"files\":")?;
+            serde_json::to_writer(&mut out, &files)?;
+            out.write_all(b"}")?;
         }
         "files" => {
             let files = if let Some(search_query) = search {
@@ -729,26 +818,46 @@ pub fn handle_api_request(endpoint: &str, db_path: &str, search: Option<&str>) -
             } else {
                 db.list_files()?
             };
-            json!(files)
+            serde_json::to_writer(&mut out, &files)?;
+        }
+        "file-table" => {
+            // The file list in column-oriented form: the field names are
+            // sent once instead of being repeated for every file
+            let files = if let Some(search_query) = search {
+                db.search_files(search_query)?
+            } else {
+                db.list_files()?
+            };
+            out.write_all(br#"{"columns":["path","language","category","purpose","symbol_count"],"rows":["#)?;
+            for (i, file) in files.iter().enumerate() {
+                if i > 0 {
+                    out.write_all(b",")?;
+                }
+                serde_json::to_writer(
+                    &mut out,
+                    &(&file.path, &file.language, &file.category, &file.purpose, file.symbol_count),
+                )?;
+            }
+            out.write_all(b"]}")?;
         }
         "symbols" => {
-            let symbols = if let Some(search_query) = search {
+            let symbols = if after.is_some() || limit.is_some() {
+                db.symbols_page(search, after, limit.unwrap_or(usize::MAX))?
+            } else if let Some(search_query) = search {
                 db.search_symbols(search_query)?
             } else {
                 db.list_symbols()?
             };
-            json!(symbols)
+            serde_json::to_writer(&mut out, &symbols)?;
         }
         "graph" => {
             let graph_data = build_graph_data(&db)?;
-            json!(graph_data)
+            serde_json::to_writer(&mut out, &graph_data)?;
         }
         _ => {
             return Err(anyhow::anyhow!("Unknown API endpoint: {}", endpoint));
         }
-    };
-    
-    println!("{}", serde_json::to_string_pretty(&response)?);
+    }
     Ok(())
 }
 
@@ -79,3 +79,31 @@ fn cli_scan_modules_and_rust_integration() {
         .unwrap();
     assert_eq!(count_sym, 1);
 }
+
+#[test]
+fn cli_api_serve_answers_each_request_line() {
+    let td = tempdir().expect("tempdir");
+    let db_path = td.path().join("serve_db");
+    let db_str = db_path.to_str().unwrap();
+
+    // Two requests against one database, the second for an unknown endpoint
+    let requests = format!(
+        "{{\"endpoint\":\"stats\",\"db\":{0:?}}}\n{{\"endpoint\":\"nope\",\"db\":{0:?}}}\n",
+        db_str
+    );
+    let output = Command::cargo_bin("symgraph-cli")
+        .expect("binary")
+        .arg("api-serve")
+        .write_stdin(requests)
+        .output()
+        .expect("run api-serve");
+    assert!(output.status.success());
+
+    let stdout = String::from_utf8(output.stdout).unwrap();
+    let lines: Vec<&str> = stdout.lines().collect();
+    assert_eq!(lines.len(), 4);
+    assert_eq!(lines[0], "ok");
+    assert!(lines[1].contains("\"files\":0"));
+    assert_eq!(lines[2], "error");
+    assert!(lines[3].contains("Unknown API endpoint"));
+}
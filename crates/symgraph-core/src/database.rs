@@ -1,4 +1,6 @@
 use anyhow::Result;
+use std::borrow::Cow;
+use std::collections::HashMap;
 use serde::{Deserialize, Serialize};
 use sled::Db;
 use uuid::Uuid;
@@ -66,25 +68,43 @@ pub struct Edge {
     pub kind: String,
 }
 
+/// The fields of a stored `Symbol` that the API reports. The rest of the
+/// record is skipped while parsing, and strings borrow from the stored
+/// bytes until a symbol is actually kept.
+#[derive(Deserialize)]
+struct SymbolRow<'a> {
+    #[serde(borrow)]
+    id: Cow<'a, str>,
+    #[serde(borrow)]
+    name: Cow<'a, str>,
+    #[serde(borrow)]
+    kind: Cow<'a, str>,
+    #[serde(borrow)]
+    file_id: Cow<'a, str>,
+}
+
 pub struct SymgraphDb {
     pub db: Db,
 }
 
 impl SymgraphDb {
     pub fn open(path: &str) -> Result<Self> {
-        let db = sled::open(path).map_err(|e| {
-            if e.to_string().contains("already exists") || e.to_string().contains("183") {
-                anyhow::anyhow!("Failed to open database at '{}': Cannot create file when it already exists. This may indicate:\n\
-                1. The database is already open by another process\n\
-                2. Insufficient permissions to access the database directory\n\
-                3. The database path is being used by another application\n\
-                \nTry closing other applications that might be using the database or choose a different path.", path)
-            } else if e.to_string().contains("IO") {
-                anyhow::anyhow!("Failed to open database at '{}': IO error: {}", path, e)
-            } else {
-                anyhow::anyhow!("Failed to open database at '{}': {}", path, e)
-            }
-        })?;
+        let db = sled::open(path).map_err(|e| open_error(path, e))?;
+        let db = Self { db };
+        if !db.db.contains_key(COUNTERS_SEEDED)? {
+            db.seed_counters()?;
+        }
+        Ok(db)
+    }
+
+    /// Open a database for a short read-only session (e.g. one API call).
+    /// Nothing is written, so sled's background flusher thread is not started.
+    pub fn open_for_reading(path: &str) -> Result<Self> {
+        let db = sled::Config::new()
+            .path(path)
+            .flush_every_ms(None)
+            .open()
+            .map_err(|e| open_error(path, e))?;
         Ok(Self { db })
     }
 
@@ -151,6 +171,7 @@ impl SymgraphDb {
             let value = serde_json::to_vec(&file)?;
             self.db.insert(&key, value.clone())?;
             self.db.insert(format!("file:{}", file.id), value)?;
+            bump_count(&self.db, "stats:files")?;
             Ok(file_id)
         }
     }
@@ -190,6 +211,29 @@ impl SymgraphDb {
     }
 }
 
+/// Explain a failure to open the database at `path`.
+fn open_error(path: &str, e: sled::Error) -> anyhow::Error {
+    if e.to_string().contains("already exists") || e.to_string().contains("183") {
+        anyhow::anyhow!("Failed to open database at '{}': Cannot create file when it already exists. This may indicate:\n\
+        1. The database is already open by another process\n\
+        2. Insufficient permissions to access the database directory\n\
+        3. The database path is being used by another application\n\
+        \nTry closing other applications that might be using the database or choose a different path.", path)
+    } else if e.to_string().contains("IO") {
+        anyhow::anyhow!("Failed to open database at '{}': IO error: {}", path, e)
+    } else {
+        anyhow::anyhow!("Failed to open database at '{}': {}", path, e)
+    }
+}
+
+/// Check whether `key` is `prefix` followed by a record id, as opposed to a
+/// lookup entry (e.g. `file:<path>`) stored under the same prefix.
+fn is_id_key(key: &[u8], prefix: &str) -> bool {
+    key.get(prefix.len()..)
+        .and_then(|id| std::str::from_utf8(id).ok())
+        .map_or(false, |id| Uuid::parse_str(id).is_ok())
+}
+
 pub fn insert_symbol(
     db: &mut SymgraphDb,
     file_id: &str,
@@ -218,6 +262,10 @@ pub fn insert_symbol(
         db.db.insert(format!("symbol_by_usr:{}", usr_val), symbol_id.as_bytes())?;
     }
     
+    // Keep the file's symbol count up to date so listing files never has
+    // to scan the symbols
+    bump_count(&db.db, &format!("symbol_count:{}", file_id))?;
+    
     Ok(symbol_id)
 }
 
@@ -272,6 +320,7 @@ pub fn insert_edge(
         db.db.insert(format!("edges_from:{}:{}:{}", from, kind, edge_id), value)?;
     }
     
+    bump_count(&db.db, "stats:edges")?;
     Ok(edge_id)
 }
 
@@ -366,82 +415,223 @@ impl SymgraphDb {
 
     /// Get database statistics
     pub fn get_stats(&self) -> Result<DatabaseStats> {
-        let mut files = 0;
-        let mut symbols = 0;
-        let mut edges = 0;
-
-        for item in self.db.scan_prefix("file:") {
-            let _ = item?;
-            files += 1;
+        // Writers keep `stats:files` and `stats:edges` current, and the symbol
+        // total is the sum of the per-file counters. A database indexed before
+        // the counters existed and not yet opened for writing is scanned.
+        if !self.db.contains_key(COUNTERS_SEEDED)? {
+            return Ok(DatabaseStats {
+                files: self.count_files()?,
+                symbols: self.count_prefix("symbol:", |_| true)?,
+                edges: self.count_prefix("edge:", |_| true)?,
+            });
         }
 
-        for item in self.db.scan_prefix("symbol:") {
-            let _ = item?;
-            symbols += 1;
+        let counter = |key: &str| -> Result<u64> {
+            Ok(self.db.get(key)?.map_or(0, |count| decode_count(&count)))
+        };
+        let mut symbols = 0;
+        for item in self.db.scan_prefix("symbol_count:") {
+            let (_, count) = item?;
+            symbols += decode_count(&count);
         }
 
-        for item in self.db.scan_prefix("edge:") {
-            let _ = item?;
-            edges += 1;
-        }
+        Ok(DatabaseStats {
+            files: counter("stats:files")?,
+            symbols,
+            edges: counter("stats:edges")?,
+        })
+    }
 
-        Ok(DatabaseStats { files, symbols, edges })
+    /// Count the files. They are stored under both their path and their id;
+    /// only the id-keyed records are counted so each file is counted once.
+    fn count_files(&self) -> Result<u64> {
+        self.count_prefix("file:", |key| is_id_key(key, "file:"))
+    }
+
+    /// Count the keys under `prefix` accepted by `filter`
+    fn count_prefix(&self, prefix: &str, filter: impl Fn(&[u8]) -> bool) -> Result<u64> {
+        let mut count = 0;
+        for item in self.db.scan_prefix(prefix) {
+            let (key, _) = item?;
+            if filter(&key) {
+                count += 1;
+            }
+        }
+        Ok(count)
     }
 
     /// List all files
     pub fn list_files(&self) -> Result<Vec<FileInfo>> {
+        // insert_symbol maintains a `symbol_count:<file id>` counter, where a
+        // missing counter means no symbols. A database indexed before the
+        // counters existed and not yet opened for writing counts by scanning
+        let scanned_counts = if self.db.contains_key(COUNTERS_SEEDED)? {
+            None
+        } else {
+            Some(self.count_symbols_by_file()?)
+        };
+
         let mut files = Vec::new();
         for item in self.db.scan_prefix("file:") {
-            let (_, value) = item?;
+            let (key, value) = item?;
+            // Skip the by-path entries, they duplicate the id-keyed records
+            if !is_id_key(&key, "file:") {
+                continue;
+            }
             if let Ok(file) = serde_json::from_slice::<File>(&value) {
+                let symbol_count = match &scanned_counts {
+                    Some(counts) => counts.get(&file.id).copied().unwrap_or(0),
+                    None => self.db.get(format!("symbol_count:{}", file.id))?
+                        .map_or(0, |count| decode_count(&count)),
+                };
                 files.push(FileInfo {
                     id: file.id,
                     path: file.path,
                     language: file.lang,
                     category: file.category.unwrap_or_default(),
                     purpose: file.purpose.unwrap_or_default(),
+                    symbol_count,
                 });
             }
         }
         Ok(files)
     }
 
+    /// Count symbols per file in one pass over the symbols; only the per-file
+    /// totals are kept, not the symbols themselves
+    fn count_symbols_by_file(&self) -> Result<HashMap<String, u64>> {
+        let mut counts: HashMap<String, u64> = HashMap::new();
+        for item in self.db.scan_prefix("symbol:") {
+            let (_, value) = item?;
+            if let Ok(symbol) = serde_json::from_slice::<SymbolRow>(&value) {
+                *counts.entry(symbol.file_id.into_owned()).or_insert(0) += 1;
+            }
+        }
+        Ok(counts)
+    }
+
+    /// Write the `symbol_count:<file id>` counters from one pass over the
+    /// symbols, and the `stats:*` counters, then mark them as seeded. Only
+    /// databases indexed before the counters existed hold any records here;
+    /// for a new one it is a few empty scans and the marker.
+    fn seed_counters(&self) -> Result<()> {
+        for (file_id, count) in self.count_symbols_by_file()? {
+            self.db.insert(format!("symbol_count:{}", file_id), count.to_be_bytes().to_vec())?;
+        }
+        self.db.insert("stats:files", self.count_files()?.to_be_bytes().to_vec())?;
+        self.db.insert("stats:edges", self.count_prefix("edge:", |_| true)?.to_be_bytes().to_vec())?;
+        // Left by earlier versions; the symbol total now comes from the per-file counters
+        self.db.remove("stats:symbols")?;
+        self.db.insert(COUNTERS_SEEDED, b"".to_vec())?;
+        Ok(())
+    }
+
     /// Search files by path
     pub fn search_files(&self, query: &str) -> Result<Vec<FileInfo>> {
         let all_files = self.list_files()?;
         let query_lower = query.to_lowercase();
         Ok(all_files
             .into_iter()
-            .filter(|f| f.path.to_lowercase().contains(&query_lower))
+            .filter(|f| contains_ignore_case(&f.path, &query_lower))
             .collect())
     }
 
     /// List all symbols
     pub fn list_symbols(&self) -> Result<Vec<SymbolInfo>> {
+        self.collect_symbols(None, None, |_| true)
+    }
+
+    /// Search symbols by name
+    pub fn search_symbols(&self, query: &str) -> Result<Vec<SymbolInfo>> {
+        let query_lower = query.to_lowercase();
+        self.collect_symbols(None, None, |name| contains_ignore_case(name, &query_lower))
+    }
+
+    /// One page of symbols, optionally filtered by name. Pages follow key
+    /// order: pass the id of the last symbol of a page as `after` to get the
+    /// next one, which seeks straight to it instead of rescanning from the start.
+    pub fn symbols_page(&self, query: Option<&str>, after: Option<&str>, limit: usize) -> Result<Vec<SymbolInfo>> {
+        match query {
+            Some(query) => {
+                let query_lower = query.to_lowercase();
+                self.collect_symbols(after, Some(limit), |name| contains_ignore_case(name, &query_lower))
+            }
+            None => self.collect_symbols(after, Some(limit), |_| true),
+        }
+    }
+
+    /// Collect the symbols whose name passes `filter`, filtering during the
+    /// scan so non-matching symbols are never turned into `SymbolInfo`.
+    /// The scan starts after the symbol with id `after` and stops at `limit`.
+    fn collect_symbols(
+        &self,
+        after: Option<&str>,
+        limit: Option<usize>,
+        filter: impl Fn(&str) -> bool,
+    ) -> Result<Vec<SymbolInfo>> {
+        let start = format!("symbol:{}", after.unwrap_or(""));
         let mut symbols = Vec::new();
-        for item in self.db.scan_prefix("symbol:") {
-            let (_, value) = item?;
-            if let Ok(symbol) = serde_json::from_slice::<Symbol>(&value) {
+        for item in self.db.range(start.as_bytes()..) {
+            let (key, value) = item?;
+            if !key.starts_with(b"symbol:") {
+                break;
+            }
+            // The cursor itself belongs to the previous page
+            if after.is_some() && key.as_ref() == start.as_bytes() {
+                continue;
+            }
+            if limit.map_or(false, |limit| symbols.len() >= limit) {
+                break;
+            }
+            if let Ok(symbol) = serde_json::from_slice::<SymbolRow>(&value) {
+                if !filter(&symbol.name) {
+                    continue;
+                }
                 symbols.push(SymbolInfo {
-                    id: symbol.id,
-                    name: symbol.name,
-                    kind: symbol.kind,
-                    file_id: symbol.file_id,
+                    id: symbol.id.into_owned(),
+                    name: symbol.name.into_owned(),
+                    kind: symbol.kind.into_owned(),
+                    file_id: symbol.file_id.into_owned(),
                 });
             }
         }
         Ok(symbols)
     }
+}
 
-    /// Search symbols by name
-    pub fn search_symbols(&self, query: &str) -> Result<Vec<SymbolInfo>> {
-        let all_symbols = self.list_symbols()?;
-        let query_lower = query.to_lowercase();
-        Ok(all_symbols
-            .into_iter()
-            .filter(|s| s.name.to_lowercase().contains(&query_lower))
-            .collect())
+/// Present once the counters cover every record. Writers seed them when they
+/// open a database indexed before the counters existed.
+const COUNTERS_SEEDED: &str = "meta:counters";
+
+/// Decode a counter stored as a big-endian u64.
+fn decode_count(bytes: &[u8]) -> u64 {
+    bytes.try_into().map(u64::from_be_bytes).unwrap_or(0)
+}
+
+/// Atomically add one to the counter stored under `key`.
+fn bump_count(db: &Db, key: &str) -> Result<()> {
+    db.update_and_fetch(key, |old| {
+        let count = old.map_or(0, decode_count) + 1;
+        Some(count.to_be_bytes().to_vec())
+    })?;
+    Ok(())
+}
+
+/// Case-insensitive substring check against an already lowercased needle.
+/// ASCII names (nearly all symbols) are compared in place without
+/// allocating a lowercased copy of every name.
+fn contains_ignore_case(haystack: &str, needle_lower: &str) -> bool {
+    if needle_lower.is_empty() {
+        return true;
+    }
+    if haystack.is_ascii() && needle_lower.is_ascii() {
+        let needle = needle_lower.as_bytes();
+        return haystack
+            .as_bytes()
+            .windows(needle.len())
+            .any(|window| window.eq_ignore_ascii_case(needle));
     }
+    haystack.to_lowercase().contains(needle_lower)
 }
 
 #[derive(serde::Serialize, serde::Deserialize)]
@@ -458,6 +648,7 @@ pub struct FileInfo {
     pub language: String,
     pub category: String,
     pub purpose: String,
+    pub symbol_count: u64,
 }
 
 #[derive(serde::Serialize, serde::Deserialize)]
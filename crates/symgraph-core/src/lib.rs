@@ -472,4 +472,338 @@ mod tests {
         drop(db);
         std::fs::remove_dir_all("test_db_10").ok();
     }
+
+    /// Демонстрация: файлы хранятся по пути и по ID, но считаются один раз
+    #[test]
+    fn test_stats_count_files_once() {
+        let mut db = Db::open("test_db_11").unwrap();
+
+        db.ensure_file("src/main.cpp", "c++").unwrap();
+        db.ensure_file("src/main.cpp", "c++").unwrap();
+        db.ensure_file("src/lib.rs", "rust").unwrap();
+
+        // Статистика и список файлов не содержат дубликатов
+        assert_eq!(db.get_stats().unwrap().files, 2);
+        assert_eq!(db.list_files().unwrap().len(), 2);
+        
+        drop(db);
+        std::fs::remove_dir_all("test_db_11").ok();
+    }
+
+    /// Демонстрация: список файлов содержит число символов каждого файла
+    #[test]
+    fn test_list_files_symbol_count() {
+        let mut db = Db::open("test_db_12").unwrap();
+
+        let main_file = db.ensure_file("src/main.cpp", "c++").unwrap();
+        let lib_file = db.ensure_file("src/lib.cpp", "c++").unwrap();
+        db.ensure_file("src/empty.cpp", "c++").unwrap();
+
+        insert_symbol(
+            &mut db,
+            &main_file,
+            Some("c:@F@main"),
+            None,
+            "main",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        insert_symbol(
+            &mut db,
+            &main_file,
+            Some("c:@F@helper"),
+            None,
+            "helper",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        insert_symbol(
+            &mut db,
+            &lib_file,
+            Some("c:@F@init"),
+            None,
+            "init",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+
+        // У каждого файла свой счётчик, файл без символов показывает 0
+        let files = db.list_files().unwrap();
+        let count = |path: &str| files.iter().find(|f| f.path == path).unwrap().symbol_count;
+        assert_eq!(count("src/main.cpp"), 2);
+        assert_eq!(count("src/lib.cpp"), 1);
+        assert_eq!(count("src/empty.cpp"), 0);
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_12").ok();
+    }
+
+    /// Демонстрация: поиск символов по подстроке без учёта регистра
+    #[test]
+    fn test_search_symbols_ignore_case() {
+        let mut db = Db::open("test_db_13").unwrap();
+        let file_id = db.ensure_file("src/parser.cpp", "c++").unwrap();
+
+        for name in ["ParseHeader", "parse_body", "Lexer"] {
+            insert_symbol(
+                &mut db,
+                &file_id,
+                None,
+                None,
+                name,
+                "FunctionDecl",
+                true,
+            )
+            .unwrap();
+        }
+
+        // Регистр запроса и имени не важен
+        let mut names: Vec<String> = db.search_symbols("PARSE").unwrap()
+            .into_iter()
+            .map(|s| s.name)
+            .collect();
+        names.sort();
+        assert_eq!(names, vec!["ParseHeader", "parse_body"]);
+
+        // Пустой запрос находит все символы
+        assert_eq!(db.search_symbols("").unwrap().len(), 3);
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_13").ok();
+    }
+
+    /// Демонстрация: постраничный вывод символов по курсору
+    #[test]
+    fn test_symbols_page() {
+        let mut db = Db::open("test_db_14").unwrap();
+        let file_id = db.ensure_file("src/main.cpp", "c++").unwrap();
+
+        for name in ["a", "b", "c", "d", "e"] {
+            insert_symbol(
+                &mut db,
+                &file_id,
+                None,
+                None,
+                name,
+                "FunctionDecl",
+                true,
+            )
+            .unwrap();
+        }
+
+        // Страницы по два символа, курсор - ID последнего символа страницы
+        let mut seen = Vec::new();
+        let mut after: Option<String> = None;
+        loop {
+            let page = db.symbols_page(None, after.as_deref(), 2).unwrap();
+            if page.is_empty() {
+                break;
+            }
+            assert!(page.len() <= 2);
+            after = Some(page.last().unwrap().id.clone());
+            seen.extend(page.into_iter().map(|s| s.name));
+        }
+
+        // Каждый символ встречается ровно один раз
+        seen.sort();
+        assert_eq!(seen, vec!["a", "b", "c", "d", "e"]);
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_14").ok();
+    }
+
+    /// Демонстрация: статистика ведётся счётчиками при записи
+    #[test]
+    fn test_stats_counters() {
+        let mut db = Db::open("test_db_15").unwrap();
+        let file_id = db.ensure_file("src/main.cpp", "c++").unwrap();
+        db.ensure_file("src/main.cpp", "c++").unwrap();
+
+        let caller = insert_symbol(
+            &mut db,
+            &file_id,
+            Some("c:@F@main#"),
+            None,
+            "main",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        let callee = insert_symbol(
+            &mut db,
+            &file_id,
+            Some("c:@F@run#"),
+            None,
+            "run",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        insert_edge(
+            &mut db,
+            Some(&caller),
+            Some(&callee),
+            None,
+            None,
+            "call",
+        )
+        .unwrap();
+
+        // Повторный ensure_file не увеличивает счётчик файлов
+        let stats = db.get_stats().unwrap();
+        assert_eq!(stats.files, 1);
+        assert_eq!(stats.symbols, 2);
+        assert_eq!(stats.edges, 1);
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_15").ok();
+    }
+
+    /// Демонстрация: SCIP-символы файла выбираются по индексу файла
+    #[test]
+    fn test_scip_symbols_for_file() {
+        let mut db = Db::open("test_db_16").unwrap();
+
+        for (id, file_id) in [("s1", "f1"), ("s2", "f2"), ("s3", "f1")] {
+            db.store_scip_symbol(&scip::ScipSymbolInfo {
+                id: id.to_string(),
+                symbol: format!("local {}", id),
+                documentation: None,
+                display_name: None,
+                symbol_kind: "Function".to_string(),
+                file_id: file_id.to_string(),
+                relationships: Vec::new(),
+            })
+            .unwrap();
+        }
+
+        // Возвращаются только символы запрошенного файла
+        let mut ids: Vec<String> = db.get_scip_symbols_for_file("f1").unwrap()
+            .into_iter()
+            .map(|s| s.id)
+            .collect();
+        ids.sort();
+        assert_eq!(ids, vec!["s1", "s3"]);
+        assert!(db.get_scip_symbols_for_file("f3").unwrap().is_empty());
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_16").ok();
+    }
+
+    /// Демонстрация: счётчики статистики старой базы начинаются с подсчёта записей
+    #[test]
+    fn test_stats_counters_seeded() {
+        let mut db = Db::open("test_db_17").unwrap();
+        let file_id = db.ensure_file("src/main.cpp", "c++").unwrap();
+        let caller = insert_symbol(
+            &mut db,
+            &file_id,
+            Some("c:@F@main#"),
+            None,
+            "main",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        let callee = insert_symbol(
+            &mut db,
+            &file_id,
+            Some("c:@F@run#"),
+            None,
+            "run",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        insert_edge(&mut db, Some(&caller), Some(&callee), None, None, "call").unwrap();
+
+        // База, записанная до появления счётчиков
+        let legacy_keys: Vec<_> = db.db.scan_prefix("stats:")
+            .chain(db.db.scan_prefix("symbol_count:"))
+            .chain(db.db.scan_prefix("meta:"))
+            .map(|item| item.unwrap().0)
+            .collect();
+        for key in legacy_keys {
+            db.db.remove(key).unwrap();
+        }
+        drop(db);
+
+        // При чтении статистика считается сканированием
+        let reader = SymgraphDb::open_for_reading("test_db_17").unwrap();
+        let stats = reader.get_stats().unwrap();
+        assert_eq!((stats.files, stats.symbols, stats.edges), (1, 2, 1));
+        drop(reader);
+
+        // Открытие для записи заполняет счётчики, новые записи добавляются к ним
+        let mut db = Db::open("test_db_17").unwrap();
+        db.ensure_file("src/lib.cpp", "c++").unwrap();
+        let helper = insert_symbol(
+            &mut db,
+            &file_id,
+            Some("c:@F@helper#"),
+            None,
+            "helper",
+            "FunctionDecl",
+            true,
+        )
+        .unwrap();
+        insert_edge(&mut db, Some(&caller), Some(&helper), None, None, "call").unwrap();
+
+        // Итоги учитывают и старые, и новые записи
+        let stats = db.get_stats().unwrap();
+        assert_eq!(stats.files, 2);
+        assert_eq!(stats.symbols, 3);
+        assert_eq!(stats.edges, 2);
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_17").ok();
+    }
+
+    /// Демонстрация: файлы старой базы без счётчиков символов
+    #[test]
+    fn test_list_files_legacy_symbol_count() {
+        let mut db = Db::open("test_db_18").unwrap();
+        let main_file = db.ensure_file("src/main.cpp", "c++").unwrap();
+        let lib_file = db.ensure_file("src/lib.cpp", "c++").unwrap();
+        for (file_id, name) in [(&main_file, "main"), (&main_file, "helper"), (&lib_file, "init")] {
+            insert_symbol(&mut db, file_id, None, None, name, "FunctionDecl", true).unwrap();
+        }
+
+        // База, записанная до появления счётчиков символов
+        let legacy_keys: Vec<_> = db.db.scan_prefix("symbol_count:")
+            .chain(db.db.scan_prefix("meta:"))
+            .map(|item| item.unwrap().0)
+            .collect();
+        for key in legacy_keys {
+            db.db.remove(key).unwrap();
+        }
+        drop(db);
+
+        // При чтении символы считаются сканированием
+        let reader = SymgraphDb::open_for_reading("test_db_18").unwrap();
+        let files = reader.list_files().unwrap();
+        let count = |path: &str| files.iter().find(|f| f.path == path).unwrap().symbol_count;
+        assert_eq!(count("src/main.cpp"), 2);
+        assert_eq!(count("src/lib.cpp"), 1);
+        drop(reader);
+
+        // Открытие для записи заполняет счётчики, новые символы добавляются к ним
+        let mut db = Db::open("test_db_18").unwrap();
+        insert_symbol(&mut db, &lib_file, None, None, "shutdown", "FunctionDecl", true).unwrap();
+        let new_file = db.ensure_file("src/new.cpp", "c++").unwrap();
+        insert_symbol(&mut db, &new_file, None, None, "run", "FunctionDecl", true).unwrap();
+        db.ensure_file("src/empty.cpp", "c++").unwrap();
+        let files = db.list_files().unwrap();
+        let count = |path: &str| files.iter().find(|f| f.path == path).unwrap().symbol_count;
+        assert_eq!(count("src/main.cpp"), 2);
+        assert_eq!(count("src/lib.cpp"), 2);
+        assert_eq!(count("src/new.cpp"), 1);
+        assert_eq!(count("src/empty.cpp"), 0);
+
+        drop(db);
+        std::fs::remove_dir_all("test_db_18").ok();
+    }
 }
@@ -3,151 +3,187 @@
 Demo script showing LSIF usage with Symgraph
 """
 
+import shlex
 import subprocess
 import sys
 import os
-from pathlib import Path
+from functools import lru_cache
 
-def run_command(cmd, description):
-    """Run a command and display results"""
+# Project paths (adjust as needed)
+PROJECT_PATH = r"D:/work/Projects/STL Desktop Tool/orthosis_mirror_app"
+SYMGRAPH_PATH = r"d:/work/Projects/symgraph"
+
+# Quote commands the way the user's shell expects so they can be copy-pasted
+_join_cmd = subprocess.list2cmdline if os.name == "nt" else shlex.join
+
+_EQ = "=" * 60
+_DASH = "-" * 60
+
+# Symgraph invocations shown in step 2; placeholders are filled per project
+_COMMAND_TEMPLATES = (
+    ("Method 1: Automatic LSIF generation", (
+        "cargo", "run", "--bin", "symgraph-cli", "--",
+        "scan-rust",
+        "--manifest-path", "{cargo_toml}",
+        "--db", "{db}",
+    )),
+    ("Method 2: Use existing LSIF file", (
+        "cargo", "run", "--bin", "symgraph-cli", "--",
+        "scan-rust",
+        "--manifest-path", "{cargo_toml}",
+        "--lsif", "{lsif}",
+        "--db", "{db}",
+    )),
+    ("Method 3: Custom LSIF path", (
+        "cargo", "run", "--bin", "symgraph-cli", "--",
+        "scan-rust",
+        "--manifest-path", "{cargo_toml}",
+        "--lsif", "custom.lsif",
+        "--db", "{db}",
+    )),
+)
+
+_BENEFITS = (
+    "✅ More accurate symbol resolution",
+    "✅ Better handling of complex Rust features",
+    "✅ Faster processing for large projects",
+    "✅ Complete semantic understanding",
+    "✅ Precise call graph generation",
+    "✅ Enhanced cross-reference analysis",
+)
+
+_TIPS = (
+    "🔄 Regenerate LSIF when code structure changes significantly",
+    "💾 LSIF files can be large - add *.lsif to .gitignore",
+    "⚡ Use LSIF for production/CI environments",
+    "🔍 Combine LSIF with source parsing for completeness",
+    "📊 Monitor LSIF generation time for large projects",
+    "🛠️  Use SYGRAPH_RUST_ANALYZER_CMD for custom rust-analyzer paths",
+)
+
+@lru_cache(maxsize=64)
+def _pstr(base, *tail):
+    """Join path components, caching the resulting string"""
+    return os.path.join(base, *tail)
+
+def run_command(cmd, description, stdout_path, cwd=None):
+    """Run a command in ``cwd`` with its output going to ``stdout_path``
+
+    The file is handed to the child as its stdout, so the output goes
+    straight to disk without passing through Python. If the command fails
+    the partly written file is removed.
+    """
     print(f"\n🔧 {description}")
-    print(f"Command: {' '.join(cmd)}")
-    print("-" * 60)
+    print(f"Command: {_join_cmd(cmd)}")
+    print(_DASH)
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        print(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
+        with open(stdout_path, "wb") as f:
+            result = subprocess.run(cmd, stdout=f, stderr=subprocess.PIPE, cwd=cwd)
+        returncode, stderr = result.returncode, result.stderr
+    except OSError as e:
         print(f"❌ Error: {e}")
-        if e.stdout:
-            print("STDOUT:", e.stdout)
-        if e.stderr:
-            print("STDERR:", e.stderr)
+        returncode, stderr = None, b""
+    
+    if returncode != 0:
+        # Don't leave a truncated file behind to be mistaken for output
+        try:
+            os.remove(stdout_path)
+        except OSError:
+            pass
+        if returncode is not None:
+            print(f"❌ Error: Command exited with status {returncode}")
+        if stderr:
+            print("STDERR:", stderr.decode(errors="replace"))
         return False
+    return True
 
 def demo_lsif_workflow():
     """Demonstrate complete LSIF workflow"""
     
-    print("🚀 LSIF Usage Demo for Symgraph")
-    print("=" * 60)
+    # Collect output and write it in one go instead of one syscall per line
+    _buf = []
+    say = _buf.append
+    
+    def flush():
+        if _buf:
+            sys.stdout.write("\n".join(_buf) + "\n")
+            sys.stdout.flush()
+            _buf.clear()
     
-    # Project path (adjust as needed)
-    project_path = Path("D:/work/Projects/STL Desktop Tool/orthosis_mirror_app")
-    symgraph_path = Path("d:/work/Projects/symgraph")
+    say("🚀 LSIF Usage Demo for Symgraph")
+    say(_EQ)
     
-    if not project_path.exists():
-        print(f"❌ Project path not found: {project_path}")
+    if not os.path.isdir(PROJECT_PATH):
+        say(f"❌ Project path not found: {PROJECT_PATH}")
+        flush()
         return
     
-    # Step 1: Generate LSIF manually
-    lsif_file = project_path / "demo_project.lsif"
+    # Step 1: Generate LSIF manually; "." is the project, so run it there
+    lsif_file = _pstr(PROJECT_PATH, "demo_project.lsif")
     cmd = ["rust-analyzer", "lsif", "."]
+    flush()
     success = run_command(
         cmd, 
-        "Step 1: Generating LSIF file with rust-analyzer"
+        "Step 1: Generating LSIF file with rust-analyzer",
+        stdout_path=lsif_file,
+        cwd=PROJECT_PATH
     )
     
     if not success:
-        print("❌ Failed to generate LSIF file")
+        say("❌ Failed to generate LSIF file")
+        flush()
         return
     
-    # Save the output
-    if success:
-        # Note: In real usage, you'd redirect output to file
-        print(f"💡 LSIF file would be saved to: {lsif_file}")
-        print(f"💡 File size: ~6.7MB for this project")
+    say(f"💡 LSIF file saved to: {lsif_file}")
+    say(f"💡 File size: {os.path.getsize(lsif_file) / (1024 * 1024):.1f}MB")
     
     # Step 2: Show Symgraph command structure
-    print(f"\n🔧 Step 2: Symgraph command structure")
-    print("-" * 60)
-    
-    db_file = project_path / "demo_with_lsif.db"
-    
-    commands = [
-        {
-            "desc": "Method 1: Automatic LSIF generation",
-            "cmd": [
-                "cargo", "run", "--bin", "symgraph-cli", "--",
-                "scan-rust",
-                "--manifest-path", str(project_path / "Cargo.toml"),
-                "--db", str(db_file)
-            ]
-        },
-        {
-            "desc": "Method 2: Use existing LSIF file", 
-            "cmd": [
-                "cargo", "run", "--bin", "symgraph-cli", "--",
-                "scan-rust",
-                "--manifest-path", str(project_path / "Cargo.toml"),
-                "--lsif", str(lsif_file),
-                "--db", str(db_file)
-            ]
-        },
-        {
-            "desc": "Method 3: Custom LSIF path",
-            "cmd": [
-                "cargo", "run", "--bin", "symgraph-cli", "--",
-                "scan-rust",
-                "--manifest-path", str(project_path / "Cargo.toml"),
-                "--lsif", "custom.lsif",
-                "--db", str(db_file)
-            ]
-        }
-    ]
+    say(f"\n🔧 Step 2: Symgraph command structure")
+    say(_DASH)
+    
+    db_file = _pstr(PROJECT_PATH, "demo_with_lsif.db")
+    cargo_toml = _pstr(PROJECT_PATH, "Cargo.toml")
+    
+    paths = {"cargo_toml": cargo_toml, "db": db_file, "lsif": lsif_file}
+    commands = []
+    for desc, template in _COMMAND_TEMPLATES:
+        cmd = [arg.format_map(paths) for arg in template]
+        commands.append({"desc": desc, "cmd": cmd, "display": _join_cmd(cmd)})
     
     for i, cmd_info in enumerate(commands, 1):
-        print(f"\n{i}. {cmd_info['desc']}:")
-        print(f"   {' '.join(cmd_info['cmd'])}")
+        say(f"\n{i}. {cmd_info['desc']}:")
+        say(f"   {cmd_info['display']}")
     
     # Step 3: Show benefits
-    print(f"\n🎯 Step 3: LSIF Benefits")
-    print("-" * 60)
+    say(f"\n🎯 Step 3: LSIF Benefits")
+    say(_DASH)
     
-    benefits = [
-        "✅ More accurate symbol resolution",
-        "✅ Better handling of complex Rust features", 
-        "✅ Faster processing for large projects",
-        "✅ Complete semantic understanding",
-        "✅ Precise call graph generation",
-        "✅ Enhanced cross-reference analysis"
-    ]
-    
-    for benefit in benefits:
-        print(f"   {benefit}")
+    say("\n".join("   " + b for b in _BENEFITS))
     
     # Step 4: Show GUI integration
-    print(f"\n🖥️  Step 4: GUI Integration")
-    print("-" * 60)
-    
-    print("When using the unified GUI:")
-    print("1. Launch: python gui/run_gui.py")
-    print("2. Select your Rust project directory")
-    print("3. Choose database location")
-    print("4. Click 'Index Project'")
-    print("5. Symgraph automatically:")
-    print("   - Detects if LSIF would be beneficial")
-    print("   - Generates LSIF if needed")
-    print("   - Processes both LSIF and source code")
-    print("   - Provides detailed progress feedback")
+    say(f"\n🖥️  Step 4: GUI Integration")
+    say(_DASH)
+    
+    say("When using the unified GUI:")
+    say("1. Launch: python gui/run_gui.py")
+    say("2. Select your Rust project directory")
+    say("3. Choose database location")
+    say("4. Click 'Index Project'")
+    say("5. Symgraph automatically:")
+    say("   - Detects if LSIF would be beneficial")
+    say("   - Generates LSIF if needed")
+    say("   - Processes both LSIF and source code")
+    say("   - Provides detailed progress feedback")
     
     # Step 5: Tips and best practices
-    print(f"\n💡 Step 5: Tips & Best Practices")
-    print("-" * 60)
-    
-    tips = [
-        "🔄 Regenerate LSIF when code structure changes significantly",
-        "💾 LSIF files can be large - add *.lsif to .gitignore",
-        "⚡ Use LSIF for production/CI environments",
-        "🔍 Combine LSIF with source parsing for completeness",
-        "📊 Monitor LSIF generation time for large projects",
-        "🛠️  Use SYGRAPH_RUST_ANALYZER_CMD for custom rust-analyzer paths"
-    ]
-    
-    for tip in tips:
-        print(f"   {tip}")
-    
-    print(f"\n✅ Demo completed! Check LSIF_USAGE.md for detailed documentation.")
+    say(f"\n💡 Step 5: Tips & Best Practices")
+    say(_DASH)
+    
+    say("\n".join("   " + t for t in _TIPS))
+    
+    say(f"\n✅ Demo completed! Check LSIF_USAGE.md for detailed documentation.")
+    flush()
 
 if __name__ == "__main__":
     demo_lsif_workflow()
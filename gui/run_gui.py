@@ -5,12 +5,12 @@ Simple launcher for the unified Symgraph GUI
 """
 import sys
 import os
-from pathlib import Path
+
+_GUI_DIR = os.path.dirname(os.path.abspath(__file__))
 
 def main():
     # Add current directory to Python path
-    gui_dir = Path(__file__).parent
-    sys.path.insert(0, str(gui_dir))
+    sys.path.insert(0, _GUI_DIR)
     
     try:
         # Import and run the unified GUI
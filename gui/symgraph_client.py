@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Symgraph API client - talks to one long-lived 'symgraph-cli api-serve'
+process instead of starting 'symgraph-cli api' for every call
+"""
+import collections
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+# Runs symgraph-cli through cargo, which builds it first if needed
+CARGO_RUN_COMMAND = ['cargo', 'run', '--package', 'symgraph-cli', '--']
+
+# Seconds api-serve may sit idle before it is stopped. Sled lets one process
+# open a database, so an idle process would otherwise keep e.g. indexing from
+# a terminal locked out for the rest of the GUI session
+IDLE_TIMEOUT = 5.0
+
+
+def find_cli_binary(repo_root):
+    """Return the symgraph-cli binary cargo has already built, or None
+
+    Running it directly skips 'cargo run' and its dependency check. With
+    both a release and a debug build present, the more recent one wins so
+    a stale build is never picked over a fresh one.
+    """
+    name = 'symgraph-cli.exe' if os.name == 'nt' else 'symgraph-cli'
+    found = []
+    for profile in ('release', 'debug'):
+        binary = os.path.join(repo_root, 'target', profile, name)
+        try:
+            found.append((os.stat(binary).st_mtime_ns, binary))
+        except OSError:
+            pass
+    return max(found)[1] if found else None
+
+
+class ServerError(RuntimeError):
+    """api-serve could not be started or exited; a one-off 'api' run may still work"""
+
+
+class ApiError(RuntimeError):
+    """api-serve answered the request with an error"""
+
+
+class SuspendedError(RuntimeError):
+    """The client is suspended; the message says why"""
+
+
+class RustClient:
+    """Send 'api' requests to a persistent symgraph-cli process
+
+    The process keeps the database open between requests, so each call
+    costs one JSON line each way rather than a process start and a database
+    open. It is stopped after idle_timeout seconds without requests, and the
+    next request starts it again. Sled lets only one process open a
+    database: suspend() the client while anything else needs to write to it,
+    and resume() afterwards.
+
+    Requests from several threads are written to the process as they come
+    and each thread waits only for its own answer, so no thread holds the
+    client while the process works on another's request.
+
+    cli_command is the command prefix that runs symgraph-cli, or a function
+    returning it; a function is called each time the process starts, so a
+    newly built binary is used from the next start on.
+    """
+
+    def __init__(self, cli_command, cwd, idle_timeout=IDLE_TIMEOUT):
+        self.cli_command = cli_command
+        self.cwd = cwd
+        self.idle_timeout = idle_timeout
+        self._server = None
+        # Reasons given to suspend() calls not yet matched by resume();
+        # requests are refused while any is outstanding
+        self._suspended = []
+        self._last_used = 0.0
+        self._idle_timer = None
+        # Guards the fields above, and keeps the order requests are written
+        # in the same as the order their answers are expected
+        self._lock = threading.Lock()
+
+    def request(self, endpoint, db_path, search=None, after=None, limit=None):
+        """Return the raw JSON response body for one API request
+
+        Raises ApiError with the server's message if the request fails,
+        SuspendedError while the client is suspended, and ServerError if
+        the process can't be started or exits.
+        """
+        line = json.dumps({'endpoint': endpoint, 'db': db_path, 'search': search,
+                           'after': after, 'limit': limit}, separators=(',', ':'))
+        with self._lock:
+            if self._suspended:
+                raise SuspendedError(self._suspended[-1])
+            if self._server is None or not self._server.alive():
+                if self._server is not None:
+                    self._server.stop()
+                self._server = _Server(self._command(), self.cwd)
+            reply = self._server.send(line.encode() + b'\n')
+            self._last_used = time.monotonic()
+            if self._idle_timer is None:
+                self._start_idle_timer(self.idle_timeout)
+        status, body = reply.result()
+        if status != b'ok':
+            raise ApiError(json.loads(body))
+        return body
+
+    def call(self, endpoint, db_path, search=None):
+        """Return the parsed JSON response for one API request"""
+        return json.loads(self.request(endpoint, db_path, search))
+
+    def suspend(self, reason="symgraph-cli api-serve is suspended"):
+        """Stop the process, releasing the database, and refuse requests until resume()
+
+        Waits for the requests in flight to be answered. Suspends nest:
+        requests are refused, with the latest reason, until every suspend()
+        has been matched by a resume() with the same reason.
+        """
+        with self._lock:
+            self._suspended.append(reason)
+            self._stop()
+
+    def resume(self, reason="symgraph-cli api-serve is suspended"):
+        """Undo the suspend() given the same reason"""
+        with self._lock:
+            if reason in self._suspended:
+                self._suspended.remove(reason)
+
+    def close(self):
+        """Stop the process; the next request starts a new one"""
+        with self._lock:
+            self._stop()
+
+    def _command(self):
+        cli_command = self.cli_command() if callable(self.cli_command) else self.cli_command
+        return cli_command + ['api-serve']
+
+    def _stop(self):
+        server, self._server = self._server, None
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        if server is not None:
+            server.stop()
+
+    def _start_idle_timer(self, delay):
+        self._idle_timer = threading.Timer(delay, self._stop_if_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _stop_if_idle(self):
+        """Stop the process once it has gone idle_timeout seconds without a request"""
+        with self._lock:
+            self._idle_timer = None
+            if self._server is None:
+                return
+            idle = time.monotonic() - self._last_used
+            if idle < self.idle_timeout or self._server.busy():
+                self._start_idle_timer(max(self.idle_timeout - idle, 0.1))
+                return
+            self._stop()
+
+
+class _Server:
+    """One api-serve process and the requests waiting for its answers"""
+
+    def __init__(self, command, cwd):
+        # stderr goes to a file so a chatty 'cargo run' build can't block it
+        self._stderr = tempfile.TemporaryFile()
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=self._stderr,
+                cwd=cwd
+            )
+        except OSError as e:
+            self._stderr.close()
+            raise ServerError(str(e)) from e
+        # Futures for the requests written and not yet answered, oldest first
+        self._pending = collections.deque()
+        self._closed = False
+        self._error = ''
+        # Serializes send() against the reader failing what is left at exit
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read_replies, daemon=True)
+        self._reader.start()
+
+    def alive(self):
+        return not self._closed and self._process.poll() is None
+
+    def busy(self):
+        return bool(self._pending)
+
+    def send(self, line):
+        """Write one request line; return a Future for its (status, body)"""
+        reply = Future()
+        with self._lock:
+            if self._closed:
+                reply.set_exception(ServerError(self._error or "symgraph-cli api-serve exited"))
+                return reply
+            self._pending.append(reply)
+        try:
+            self._process.stdin.write(line)
+            self._process.stdin.flush()
+        except OSError:
+            # The process is gone; the reader fails the request once it sees EOF
+            pass
+        return reply
+
+    def stop(self):
+        """Let the process answer what it was sent, then stop it"""
+        try:
+            # Closing stdin ends its request loop
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._reader.join()
+
+    def _read_replies(self):
+        """Hand each answer to the oldest waiting request, until the process exits"""
+        stdout = self._process.stdout
+        while True:
+            status = stdout.readline()
+            body = stdout.readline()
+            if not body:
+                break
+            if self._pending:
+                self._pending.popleft().set_result((status.strip(), body))
+
+        # Report what the process said to whatever is still waiting
+        self._process.wait()
+        stdout.close()
+        self._stderr.seek(0)
+        error = self._stderr.read().decode(errors='replace').strip()
+        self._stderr.close()
+        with self._lock:
+            self._closed = True
+            self._error = error
+            waiting = list(self._pending)
+            self._pending.clear()
+        for reply in waiting:
+            reply.set_exception(ServerError(error or "symgraph-cli api-serve exited"))
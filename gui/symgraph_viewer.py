@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Symgraph web viewer - Flask app serving the static viewer pages and the
+/api/* endpoints they call, backed by 'symgraph-cli api'
+"""
+import functools
+import json
+import mimetypes
+import os
+import stat
+import subprocess
+import tempfile
+import threading
+
+from flask import Flask, Response, abort, g, request, jsonify, make_response
+from werkzeug.utils import safe_join
+
+from symgraph_client import (CARGO_RUN_COMMAND, ApiError, ServerError, SuspendedError,
+                             find_cli_binary)
+
+# Workspace root the CLI runs from, and the viewer's static pages
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(REPO_ROOT, 'static')
+
+# Served in place of static/index.html when it is missing
+FALLBACK_HTML = b"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Error</title>
+</head>
+<body>
+    <h1>Error</h1>
+    <p>Static files not found. Please ensure the static directory exists with index.html</p>
+</body>
+</html>
+"""
+
+# Response bodies kept per app, see cached_rust_api()
+RESPONSE_CACHE_SIZE = 64
+
+
+def find_cli_command():
+    """Return the command prefix that runs symgraph-cli"""
+    binary = find_cli_binary(REPO_ROOT)
+    return [binary] if binary else list(CARGO_RUN_COMMAND)
+
+
+def cli_args(cli_command, endpoint, db_path, search=None, after=None, limit=None):
+    """Build the symgraph-cli api command line for endpoint"""
+    cmd = cli_command + ['api', endpoint, '--db', db_path]
+    if search:
+        cmd.extend(['--search', search])
+    if after:
+        cmd.extend(['--after', after])
+    if limit:
+        cmd.extend(['--limit', str(limit)])
+    return cmd
+
+
+def call_rust_api(cli_command, endpoint, db_path, search=None, on_complete=None):
+    """Call Rust symgraph CLI to get data
+
+    If on_complete is given it receives the raw output when the CLI succeeds.
+    """
+    try:
+        cmd = cli_args(cli_command, endpoint, db_path, search)
+
+        # Bytes straight into json.loads, which decodes UTF-8 itself
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            cwd=REPO_ROOT
+        )
+
+        if result.returncode == 0:
+            data = json.loads(result.stdout)
+            if on_complete:
+                on_complete(result.stdout)
+            return data
+        else:
+            return {"error": result.stderr.decode(errors='replace'), "code": result.returncode}
+    except Exception as e:
+        return {"error": str(e), "code": 500}
+
+
+def stream_rust_api(cli_command, endpoint, db_path, search=None, on_complete=None,
+                    after=None, limit=None):
+    """Stream the Rust CLI's JSON output straight into the response body
+
+    If on_complete is given it receives the full body once the CLI exits
+    successfully.
+    """
+    cmd = cli_args(cli_command, endpoint, db_path, search, after, limit)
+
+    # stderr goes to a file so a chatty build can't block the stdout pipe
+    stderr = tempfile.TemporaryFile()
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            cwd=REPO_ROOT
+        )
+    except Exception as e:
+        stderr.close()
+        return jsonify({"error": str(e), "code": 500}), 500
+
+    # Failures only show up before the first byte of output; wait for it
+    # so they can still be reported with a proper status code
+    first = process.stdout.read1(64 * 1024)
+    if not first:
+        code = process.wait()
+        process.stdout.close()
+        stderr.seek(0)
+        error = stderr.read().decode(errors='replace')
+        stderr.close()
+        if code != 0:
+            return jsonify({"error": error, "code": code}), 500
+        return jsonify([])
+
+    def generate():
+        chunks = [first]
+        try:
+            yield first
+            for chunk in iter(lambda: process.stdout.read1(64 * 1024), b''):
+                if on_complete:
+                    chunks.append(chunk)
+                yield chunk
+            if process.wait() == 0 and on_complete:
+                on_complete(b''.join(chunks))
+        finally:
+            process.stdout.close()
+            process.wait()
+            stderr.close()
+
+    return Response(generate(), mimetype='application/json')
+
+
+def db_etag(db_path):
+    """Return an ETag for the database contents, or None if it can't be read"""
+    # sled rewrites its 'db' file whenever the index changes
+    try:
+        st = os.stat(os.path.join(db_path, 'db'))
+    except OSError:
+        return None
+    return f'{st.st_mtime_ns:x}-{st.st_size:x}'
+
+
+@functools.lru_cache(maxsize=32)
+def read_static_bytes(path, mtime_ns):
+    """Return the contents of a static file, cached per modification time"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def load_index_html():
+    """Return static/index.html, reading it from disk only when it changes"""
+    path = os.path.join(STATIC_DIR, 'index.html')
+    return read_static_bytes(path, os.stat(path).st_mtime_ns)
+
+
+def create_app(db_path, api_client=None):
+    """Create the viewer app for the Sled database at db_path
+
+    api_client, if given, is a symgraph_client.RustClient that answers API
+    calls from a long-lived CLI process; without one (or when that process
+    can't run) each call runs 'symgraph-cli api'.
+    """
+    app = Flask(__name__, static_folder=None)
+    # jsonify() output is read by the page's scripts only; don't spend time
+    # sorting the keys of every reshaped file and symbol
+    app.json.sort_keys = False
+    app.config['DB_PATH'] = db_path
+    app.config['API_CLIENT'] = api_client
+    # Resolved once when the app is created and shared by every request
+    app.config['CLI_COMMAND'] = find_cli_command()
+
+    # Response bodies keyed by (db_path, endpoint, search), each stored with
+    # the ETag of the database it was produced from so a rebuilt index
+    # never serves them. Requests run on their own threads, so the cache is
+    # only read or changed under the lock
+    response_cache = {}
+    response_cache_lock = threading.Lock()
+
+    def cache_lookup(endpoint, search):
+        """Return (cached body or None, store callback or None) for a CLI call"""
+        key = (app.config['DB_PATH'], endpoint, search)
+        etag = request_etag()
+        if not etag:
+            return None, None
+        with response_cache_lock:
+            cached = response_cache.get(key)
+        if cached and cached[0] == etag:
+            return cached[1], None
+
+        def store(body):
+            with response_cache_lock:
+                response_cache.pop(key, None)
+                if len(response_cache) >= RESPONSE_CACHE_SIZE:
+                    response_cache.pop(next(iter(response_cache)), None)
+                response_cache[key] = (etag, body)
+
+        return None, store
+
+    def client_body(endpoint, search=None, after=None, limit=None):
+        """Ask the API client for a response body; None means run the CLI instead
+
+        The client's errors end the request: a one-off CLI run couldn't open
+        the database the server or the indexer holds, and would only report
+        that instead.
+        """
+        client = app.config['API_CLIENT']
+        if client is None:
+            return None
+        try:
+            return client.request(endpoint, app.config['DB_PATH'], search, after, limit)
+        except ServerError:
+            # No api-serve (e.g. a binary built before it existed); the
+            # process has exited, so the CLI can open the database
+            return None
+        except SuspendedError as e:
+            abort(make_response(jsonify({"error": str(e), "code": 503}), 503))
+        except ApiError as e:
+            abort(make_response(jsonify({"error": str(e), "code": 500}), 500))
+
+    def cached_body(endpoint, search):
+        """Return (body or None, store callback or None), asking the client on a miss"""
+        body, store = cache_lookup(endpoint, search)
+        if body is None:
+            body = client_body(endpoint, search)
+            if body is not None and store:
+                store(body)
+                store = None
+        return body, store
+
+    def cached_rust_api(endpoint, search=None):
+        """Serve a CLI response from memory while the database is unchanged"""
+        body, store = cached_body(endpoint, search)
+        if body is not None:
+            return Response(body, mimetype='application/json')
+        return stream_rust_api(app.config['CLI_COMMAND'], endpoint, app.config['DB_PATH'],
+                               search, on_complete=store)
+
+    def cached_rust_json(endpoint, search=None):
+        """Like call_rust_api, sharing cached_rust_api's cached bodies"""
+        body, store = cached_body(endpoint, search)
+        if body is not None:
+            return json.loads(body)
+        return call_rust_api(app.config['CLI_COMMAND'], endpoint, app.config['DB_PATH'],
+                             search, on_complete=store)
+
+    def request_etag():
+        """Return the database ETag, computed at most once per request"""
+        if 'db_etag' not in g:
+            g.db_etag = db_etag(app.config['DB_PATH'])
+        return g.db_etag
+
+    def conditional(view):
+        """Answer If-None-Match with 304 while the database is unchanged"""
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = request_etag()
+            if etag and etag in request.if_none_match:
+                # Nothing changed since the browser's copy: skip the CLI entirely
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if not etag or response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            # Always revalidate: the index can be rebuilt at any moment
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+
+    @app.route('/')
+    def index():
+        # Serve the static HTML file
+        try:
+            return Response(load_index_html(), mimetype='text/html')
+        except FileNotFoundError:
+            return Response(FALLBACK_HTML, status=404, mimetype='text/html')
+
+    @app.route('/static/<path:filename>')
+    def serve_static(filename):
+        """Serve static files"""
+        # The viewer's assets are a few small files: keep them in memory per
+        # modification time, like index.html, instead of reopening them for
+        # every request
+        path = safe_join(STATIC_DIR, filename)
+        try:
+            st = os.stat(path) if path else None
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            abort(404)
+        mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        response = Response(read_static_bytes(path, st.st_mtime_ns), mimetype=mimetype)
+        response.set_etag(f'{st.st_mtime_ns:x}-{st.st_size:x}')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
+
+    @app.route('/api/stats')
+    @conditional
+    def get_stats():
+        return cached_rust_api('stats')
+
+    @app.route('/api/files')
+    @conditional
+    def get_files():
+        # Column-oriented {columns, rows} rather than one object per file
+        search = request.args.get('search', '')
+        return cached_rust_api('file-table', search if search else None)
+
+    @app.route('/api/symbols')
+    def get_symbols():
+        # Optional paging: ?limit=N, then ?after=<id of the last symbol> for
+        # the next page
+        search = request.args.get('search', '')
+        after = request.args.get('after') or None
+        limit = request.args.get('limit', type=int)
+        if not after and not limit:
+            # The full list is what /api/scip/symbols reshapes; share it
+            return cached_rust_api('symbols', search if search else None)
+        body = client_body('symbols', search if search else None, after, limit)
+        if body is not None:
+            return Response(body, mimetype='application/json')
+        return stream_rust_api(app.config['CLI_COMMAND'], 'symbols', app.config['DB_PATH'],
+                               search if search else None, after=after, limit=limit)
+
+    @app.route('/api/scip/documents')
+    def get_scip_documents():
+        # For SCIP documents, we'll use files endpoint and filter by SCIP-related categories
+        data = cached_rust_json('files')
+        if 'error' in data:
+            return jsonify(data), 500
+
+        # Filter files that might be SCIP-related (category containing 'scip' or similar),
+        # reading each field once and only building entries for the matches
+        scip_files = []
+        for f in data:
+            category = f.get('category') or ''
+            purpose = f.get('purpose') or ''
+            if 'scip' not in category.lower() and 'scip' not in purpose.lower():
+                continue
+            scip_files.append({
+                'relative_path': f.get('path', ''),
+                'language': f.get('language', f.get('lang', '')),
+                'category': category,
+                'purpose': purpose,
+                'symbol_count': f.get('symbol_count', 0)
+            })
+
+        return jsonify(scip_files)
+
+    @app.route('/api/scip/symbols')
+    def get_scip_symbols():
+        search = request.args.get('search', '')
+        data = cached_rust_json('symbols', search if search else None)
+        if 'error' in data:
+            return jsonify(data), 500
+
+        # Transform symbols to SCIP format
+        scip_symbols = [
+            {
+                'display_name': s.get('name', ''),
+                'symbol_kind': s.get('kind', ''),
+                'symbol': s.get('name', ''),
+                'file_path': s.get('file_id', ''),
+                'category': 'scip'
+            }
+            for s in data
+        ]
+
+        return jsonify(scip_symbols)
+
+    return app
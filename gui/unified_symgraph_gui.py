@@ -5,18 +5,66 @@ Unified Symgraph GUI - combines indexing and viewing functionality
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import re
+import fnmatch
 import subprocess
 import threading
+import queue
 import json
-import webbrowser
+import codecs
+import io
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import tempfile
-import shutil
-import requests
+from collections import Counter, OrderedDict, defaultdict
+import heapq
+import signal
+import stat
 import time
 
+# Workspace root symgraph-cli runs from (the directory above gui/)
+_REPO_ROOT = str(Path(__file__).resolve().parents[1])
+
+# Run indexing in its own process group so it can be stopped as a whole
+if os.name == 'nt':
+    _NEW_GROUP = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _NEW_GROUP = {'start_new_session': True}
+
 class UnifiedSymgraphGUI:
+    # How often queued log lines are flushed to the output widget (~30 Hz)
+    LOG_FLUSH_MS = 33
+    # Upper bound on lines inserted per flush so the UI stays responsive;
+    # a queued entry can hold many lines and is split to respect it
+    LOG_FLUSH_MAX_LINES = 1000
+    # The output widget keeps at most this many lines; the oldest are
+    # dropped in blocks of LOG_TRIM_LINES once the limit is passed
+    LOG_MAX_LINES = 5000
+    LOG_TRIM_LINES = 1000
+    
+    # Why the API client is suspended, reported to API callers meanwhile
+    SUSPEND_INDEXING = "Indexing in progress; try again when it finishes"
+    SUSPEND_CLEARING = "The database is being cleared"
+    
+    # Directories whose detected project type is remembered
+    DETECT_CACHE_SIZE = 128
+    # Coarsest directory timestamp resolution to expect (FAT: 2 s). A
+    # directory changed more recently than this is not cached: a further
+    # change within the same tick would leave its mtime unchanged
+    DETECT_MTIME_GRANULARITY_NS = 2_000_000_000
+    
+    # Which type wins when a directory has indicators of several: the most
+    # specific manifests first, so a Rust crate with a helper Makefile or
+    # CMakeLists.txt is still indexed as Rust
+    DETECTION_ORDER = ('Rust', 'C++', 'Python', 'JavaScript/TypeScript')
+    
+    # Settings used when the settings file is missing or unreadable
+    DEFAULT_SETTINGS = {
+        'last_project_dir': '',
+        'last_db_path': '',
+        'window_geometry': '',
+        'auto_open_viewer': True
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Symgraph - Unified Project Analyzer & Viewer")
@@ -24,6 +72,8 @@ class UnifiedSymgraphGUI:
         
         # Settings
         self.settings_file = 'unified_gui_settings.json'
+        self._last_saved_settings_json = None
+        self._save_after_id = None
         self.load_settings()
         
         # Project configurations
@@ -73,45 +123,101 @@ class UnifiedSymgraphGUI:
             }
         }
         
+        # Map every exact indicator file name to its project type and compile
+        # each type's glob patterns into a single regex, both in
+        # DETECTION_ORDER priority order
+        self._type_rank = {project_type: rank for rank, project_type in enumerate(self.DETECTION_ORDER)}
+        self._indicator_to_type = {}
+        self._indicator_globs = []
+        for project_type in self.DETECTION_ORDER:
+            config = self.project_configs[project_type]
+            globs = []
+            for indicator in config['indicators']:
+                if any(c in indicator for c in '*?['):
+                    globs.append(fnmatch.translate(indicator))
+                else:
+                    self._indicator_to_type.setdefault(indicator, project_type)
+            if globs:
+                self._indicator_globs.append((project_type, re.compile('|'.join(globs))))
+        
+        # Detected project types keyed by directory, with the directory mtime.
+        # Detection threads can overlap, so the cache is only used under the lock
+        self._detect_cache = OrderedDict()
+        self._detect_lock = threading.Lock()
+        
+        # Parsed 'symgraph-cli api' results keyed by (endpoint, db_path), plus
+        # the summaries built from them under ('summary', db_path), each
+        # stored with the database_stamp() it was read from
+        self._api_cache = {}
+        
+        # Long-lived 'symgraph-cli api-serve' process, see api_client(). Built
+        # here, before any thread can ask for it, so there is only ever one;
+        # the process itself starts on the first request
+        from symgraph_client import RustClient
+        self._api_client = RustClient(self.cli_command, _REPO_ROOT)
+        
+        # Parameter frames per project type, created on first use
+        self._param_frames = {}
+        self._params_type = None
+        self.param_vars = {}
+        
         # State
         self.current_project = None
         self.current_db_path = None
         self.indexing_thread = None
-        self.web_server_process = None
+        self._current_process = None
+        self.web_server = None
+        self.web_server_db = None
+        
+        # Log lines are queued by any thread and flushed on the Tk thread;
+        # the part of an entry that didn't fit in the last flush waits here
+        self._log_queue = queue.Queue()
+        self._log_pending = None
         
         self.create_widgets()
         self.apply_styles()
+        self.root.after(self.LOG_FLUSH_MS, self._drain_log_queue)
         
     def load_settings(self):
         """Load settings from file"""
+        # One open and one parse; the text just read is what the next save
+        # compares against, so nothing is re-serialized at startup
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    self.settings = json.load(f)
-            else:
-                self.settings = {
-                    'last_project_dir': '',
-                    'last_db_path': '',
-                    'window_geometry': '',
-                    'auto_open_viewer': True
-                }
+            with open(self.settings_file, 'r') as f:
+                data = f.read()
+            self.settings = json.loads(data)
+            self._last_saved_settings_json = data
         except Exception:
-            self.settings = {
-                'last_project_dir': '',
-                'last_db_path': '',
-                'window_geometry': '',
-                'auto_open_viewer': True
-            }
+            self.settings = dict(self.DEFAULT_SETTINGS)
     
     def save_settings(self):
-        """Save settings to file"""
+        """Save settings to file if they changed since the last save"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
         try:
             self.settings['window_geometry'] = self.root.geometry()
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Compact: the file is written by the GUI, not edited by hand
+            data = json.dumps(self.settings, separators=(',', ':'))
+            if data == self._last_saved_settings_json:
+                return
+            
+            # Write to a temporary file and swap it in so a crash mid-write
+            # can't leave a truncated settings file behind
+            tmp_file = self.settings_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                f.write(data)
+            os.replace(tmp_file, self.settings_file)
+            self._last_saved_settings_json = data
         except Exception as e:
             print(f"Failed to save settings: {e}")
     
+    def schedule_save_settings(self, delay_ms=500):
+        """Save settings after a short delay, collapsing bursts of changes into one write"""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(delay_ms, self.save_settings)
+    
     def create_widgets(self):
         """Create all GUI widgets"""
         # Create notebook for tabs
@@ -192,7 +298,8 @@ class UnifiedSymgraphGUI:
         self.stop_button = ttk.Button(action_frame, text="⏹ Stop", command=self.stop_indexing, state='disabled')
         self.stop_button.pack(side='left', padx=5)
         
-        ttk.Button(action_frame, text="🗑 Clear Database", command=self.clear_database).pack(side='left', padx=5)
+        self.clear_button = ttk.Button(action_frame, text="🗑 Clear Database", command=self.clear_database)
+        self.clear_button.pack(side='left', padx=5)
         
         # Progress section
         progress_frame = ttk.LabelFrame(main_container, text="Progress", padding="10")
@@ -240,7 +347,7 @@ class UnifiedSymgraphGUI:
         self.viewer_db_entry = ttk.Entry(db_row, textvariable=self.viewer_db_var, width=50)
         self.viewer_db_entry.pack(side='left', padx=(10, 5), fill='x', expand=True)
         ttk.Button(db_row, text="Browse...", command=self.browse_viewer_db).pack(side='left')
-        ttk.Button(db_row, text="🔄 Refresh", command=self.refresh_database_info).pack(side='left', padx=5)
+        ttk.Button(db_row, text="🔄 Refresh", command=self.reload_database_info).pack(side='left', padx=5)
         
         # Database info
         self.db_info_var = tk.StringVar(value="No database loaded")
@@ -271,9 +378,9 @@ class UnifiedSymgraphGUI:
             self.results_tree.column(col, width=150)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(preview_frame, orient='vertical', command=self.results_tree.yview)
-        scrollbar.pack(side='right', fill='y')
-        self.results_tree.configure(yscrollcommand=scrollbar.set)
+        self.results_scrollbar = ttk.Scrollbar(preview_frame, orient='vertical', command=self.results_tree.yview)
+        self.results_scrollbar.pack(side='right', fill='y')
+        self.results_tree.configure(yscrollcommand=self.results_scrollbar.set)
         
     def create_settings_tab(self):
         """Create the settings tab"""
@@ -373,33 +480,86 @@ Features:
     def detect_project_type(self):
         """Detect project type from directory contents"""
         directory = self.project_dir_var.get()
-        if not directory or not os.path.exists(directory):
+        if not directory:
             self.project_type_var.set("Directory not found")
             return
         
-        detected_type = "Unknown"
-        for project_type, config in self.project_configs.items():
-            for indicator in config['indicators']:
-                if '*' in indicator:
-                    import glob
-                    if glob.glob(os.path.join(directory, indicator)):
-                        detected_type = project_type
-                        break
-                else:
-                    if os.path.exists(os.path.join(directory, indicator)):
-                        detected_type = project_type
-                        break
-            if detected_type != "Unknown":
-                break
-        
+        # Scanning a slow or network drive must not block the Tk event loop
+        self.project_type_var.set("Detecting...")
+        threading.Thread(target=self._detect_project_type_worker, args=(directory,), daemon=True).start()
+    
+    def _detect_project_type_worker(self, directory):
+        """Detect project type in a background thread and report back on the Tk thread"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            detected_type = "Directory not found"
+        else:
+            key = os.path.abspath(directory)
+            with self._detect_lock:
+                cached = self._detect_cache.get(key)
+                if cached and cached[0] == mtime:
+                    self._detect_cache.move_to_end(key)
+            if cached and cached[0] == mtime:
+                detected_type = cached[1]
+            else:
+                # Scan without holding the lock so other detections don't wait
+                detected_type = self._scan_project_type(directory)
+                if time.time_ns() - mtime >= self.DETECT_MTIME_GRANULARITY_NS:
+                    with self._detect_lock:
+                        self._detect_cache[key] = (mtime, detected_type)
+                        self._detect_cache.move_to_end(key)
+                        # Forget the least recently detected directories
+                        while len(self._detect_cache) > self.DETECT_CACHE_SIZE:
+                            self._detect_cache.popitem(last=False)
+        
+        self.root.after(0, self._apply_detected_type, directory, detected_type)
+    
+    def _apply_detected_type(self, directory, detected_type):
+        """Show detection result unless the user has since picked another directory"""
+        if directory != self.project_dir_var.get():
+            return
         self.project_type_var.set(detected_type)
         self.update_params_frame(detected_type)
     
+    def _scan_project_type(self, directory):
+        """Return the project type whose indicators are present in directory"""
+        # Read the directory once and match every indicator against it
+        try:
+            with os.scandir(directory) as it:
+                entries = {entry.name for entry in it}
+        except OSError:
+            entries = set()
+        
+        # One hash lookup per entry finds the best literal match
+        detected_type = None
+        for name in entries:
+            project_type = self._indicator_to_type.get(name)
+            if project_type and (detected_type is None
+                                 or self._type_rank[project_type] < self._type_rank[detected_type]):
+                detected_type = project_type
+                if self._type_rank[project_type] == 0:
+                    # Nothing outranks the first type: no need to look further
+                    return project_type
+        
+        # Glob patterns only matter for types that outrank the literal match
+        for project_type, pattern in self._indicator_globs:
+            if detected_type and self._type_rank[project_type] >= self._type_rank[detected_type]:
+                break
+            if any(pattern.match(name) for name in entries):
+                return project_type
+        return detected_type or "Unknown"
+    
     def update_params_frame(self, project_type):
         """Update parameters frame based on project type"""
-        # Clear existing widgets
-        for widget in self.params_frame.winfo_children():
-            widget.destroy()
+        if project_type == self._params_type:
+            return
+        
+        # Hide the previous type's fields; each type's frame is built once and reused
+        if self._params_type in self._param_frames:
+            self._param_frames[self._params_type][0].pack_forget()
+        self._params_type = project_type
+        self.param_vars = {}
         
         if project_type not in self.project_configs:
             return
@@ -408,19 +568,29 @@ Features:
         if 'params' not in config:
             return
         
-        self.param_vars = {}
+        if project_type not in self._param_frames:
+            self._param_frames[project_type] = self.create_params_frame(config['params'])
+        type_frame, self.param_vars = self._param_frames[project_type]
+        type_frame.pack(fill='x')
+    
+    def create_params_frame(self, params):
+        """Create entry widgets for params, returning (frame, {param_name: StringVar})"""
+        type_frame = ttk.Frame(self.params_frame)
+        param_vars = {}
         
-        for i, (param_name, param_label, param_desc, default_value) in enumerate(config['params']):
-            row_frame = ttk.Frame(self.params_frame)
+        for i, (param_name, param_label, param_desc, default_value) in enumerate(params):
+            row_frame = ttk.Frame(type_frame)
             row_frame.pack(fill='x', pady=2)
             
             ttk.Label(row_frame, text=f"{param_label}:").pack(side='left')
             
             var = tk.StringVar(value=default_value)
-            self.param_vars[param_name] = var
+            param_vars[param_name] = var
             
             entry = ttk.Entry(row_frame, textvariable=var, width=30)
             entry.pack(side='left', padx=(10, 0), fill='x', expand=True)
+        
+        return type_frame, param_vars
     
     def start_indexing(self):
         """Start the indexing process"""
@@ -437,7 +607,7 @@ Features:
         
         # Detect project type
         project_type = self.project_type_var.get()
-        if project_type == "Unknown":
+        if project_type not in self.project_configs:
             messagebox.showerror("Error", "Could not detect project type. Please select a valid project directory.")
             return
         
@@ -454,38 +624,48 @@ Features:
         # Save settings
         self.settings['last_project_dir'] = project_dir
         self.settings['last_db_path'] = db_path
-        self.save_settings()
+        self.schedule_save_settings()
+        
+        # Tk variables may only be read on this thread, so hand the worker
+        # a snapshot of the parameters
+        params = {name: var.get() for name, var in self.param_vars.items()}
+        auto_open_viewer = self.auto_open_viewer_var.get()
         
         # Start indexing in background thread
-        self.indexing_thread = threading.Thread(target=self.run_indexing, args=(project_dir, db_path, project_type))
+        self.indexing_thread = threading.Thread(target=self.run_indexing,
+                                                args=(project_dir, db_path, project_type, params,
+                                                      auto_open_viewer))
         self.indexing_thread.daemon = True
         self.indexing_thread.start()
     
-    def run_indexing(self, project_dir, db_path, project_type):
+    def run_indexing(self, project_dir, db_path, project_type, params, auto_open_viewer):
         """Run indexing in background thread"""
+        # The indexer needs the database to itself. Suspending waits for any
+        # API request in flight, so it is done here rather than on the Tk thread
+        self.api_client().suspend(self.SUSPEND_INDEXING)
         try:
             config = self.project_configs[project_type]
             command = config['command']
             
             # Build command arguments
-            cmd_args = ['cargo', 'run', '--package', 'symgraph-cli', '--', command, '--db', db_path]
+            cmd_args = self.cli_command() + [command, '--db', db_path]
             
             # Add project-specific parameters
             if project_type == 'C++':
-                build_dir = self.param_vars.get('build_dir', tk.StringVar()).get()
+                build_dir = params.get('build_dir', '')
                 if build_dir:
                     cmd_args.extend(['--build-dir', build_dir])
                 
-                generator = self.param_vars.get('generator', tk.StringVar()).get()
+                generator = params.get('generator', '')
                 if generator:
                     cmd_args.extend(['--generator', generator])
                 
-                compdb_path = self.param_vars.get('compdb_path', tk.StringVar()).get()
+                compdb_path = params.get('compdb_path', '')
                 if compdb_path and compdb_path != 'auto':
                     cmd_args.extend(['--compdb', compdb_path])
             
             elif project_type == 'Rust':
-                manifest_path = self.param_vars.get('manifest_path', tk.StringVar()).get()
+                manifest_path = params.get('manifest_path', '')
                 if manifest_path:
                     # Convert relative path to absolute path
                     if not os.path.isabs(manifest_path):
@@ -494,7 +674,7 @@ Features:
                         full_manifest_path = manifest_path
                     cmd_args.extend(['--manifest', full_manifest_path])
                 
-                lsif_path = self.param_vars.get('lsif_path', tk.StringVar()).get()
+                lsif_path = params.get('lsif_path', '')
                 if lsif_path:
                     cmd_args.extend(['--lsif', lsif_path])
             
@@ -509,39 +689,53 @@ Features:
                 cmd_args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                cwd='d:\\work\\Projects\\symgraph'
+                bufsize=64 * 1024,
+                cwd=_REPO_ROOT,
+                **_NEW_GROUP
             )
+            self._current_process = process
             
-            # Read output in real-time
+            # Read output in real-time, a chunk at a time: each chunk is decoded
+            # once (with \r\n folded to \n) and everything up to its last
+            # newline is queued as a single log entry, without splitting lines
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder('utf-8')('replace'), translate=True)
+            pending = ''
             while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
+                chunk = process.stdout.read1(64 * 1024)
+                if not chunk:
                     break
-                if output:
-                    self.log_output(output.strip())
+                complete, newline, pending = (pending + decoder.decode(chunk)).rpartition('\n')
+                if newline:
+                    self.log_output(complete)
+            pending += decoder.decode(b'', final=True)
+            if pending.strip():
+                self.log_output(pending.rstrip())
+            process.wait()
             
             # Check result
             if process.returncode == 0:
                 self.log_output("Indexing completed successfully!")
-                self.progress_var.set("Indexing completed successfully!")
+                self.root.after(0, self.progress_var.set, "Indexing completed successfully!")
                 
                 # Update current project info
                 self.current_project = project_dir
                 self.current_db_path = db_path
                 
                 # Auto-open viewer if enabled
-                if self.auto_open_viewer_var.get():
+                if auto_open_viewer:
                     self.root.after(1000, self.open_web_viewer)
             else:
                 self.log_output(f"Indexing failed with return code: {process.returncode}")
-                self.progress_var.set("Indexing failed!")
+                self.root.after(0, self.progress_var.set, "Indexing failed!")
         
         except Exception as e:
             self.log_output(f"Error during indexing: {str(e)}")
-            self.progress_var.set(f"Error: {str(e)}")
+            self.root.after(0, self.progress_var.set, f"Error: {str(e)}")
         
         finally:
+            self._current_process = None
+            self.api_client().resume(self.SUSPEND_INDEXING)
             # Update UI
             self.root.after(0, self.indexing_complete)
     
@@ -553,6 +747,7 @@ Features:
         self.status_var.set("Ready")
         
         # Refresh database info
+        self.invalidate_api_cache()
         self.refresh_database_info()
     
     def stop_indexing(self):
@@ -560,12 +755,66 @@ Features:
         if self.indexing_thread and self.indexing_thread.is_alive():
             self.log_output("Stopping indexing...")
             self.progress_var.set("Stopping...")
+            
+            # Signal the whole process group: cargo (if used) and the indexer it
+            # launched both exit, and the reader thread then sees EOF
+            process = self._current_process
+            if process and process.poll() is None:
+                try:
+                    if os.name == 'nt':
+                        process.send_signal(signal.CTRL_BREAK_EVENT)
+                    else:
+                        os.killpg(process.pid, signal.SIGTERM)
+                except OSError:
+                    process.terminate()
     
     def log_output(self, message):
-        """Log message to output widget"""
-        self.output_log.insert(tk.END, f"{message}\n")
-        self.output_log.see(tk.END)
-        self.root.update_idletasks()
+        """Queue message for the output widget (safe to call from any thread)"""
+        self._log_queue.put(message)
+    
+    def _drain_log_queue(self):
+        """Flush queued log lines to the output widget in a single insert"""
+        lines = []
+        queued = 0
+        entry = self._log_pending
+        while queued < self.LOG_FLUSH_MAX_LINES:
+            if entry is None:
+                try:
+                    entry = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+            room = self.LOG_FLUSH_MAX_LINES - queued
+            # Entries are whole chunks of output: count their lines, and cut
+            # one that doesn't fit after the last line there is room for
+            cut = -1
+            for _ in range(room):
+                cut = entry.find('\n', cut + 1)
+                if cut < 0:
+                    break
+            if cut < 0:
+                lines.append(entry)
+                queued += entry.count('\n') + 1
+                entry = None
+            else:
+                lines.append(entry[:cut])
+                queued += room
+                entry = entry[cut + 1:]
+        self._log_pending = entry
+        
+        if lines:
+            # Follow new output only if the user hasn't scrolled up to read
+            # something earlier
+            follow = self.output_log.yview()[1] >= 1.0
+            lines.append('')
+            self.output_log.insert(tk.END, '\n'.join(lines))
+            line_count = int(self.output_log.index('end-1c').split('.')[0])
+            if line_count > self.LOG_MAX_LINES:
+                keep = self.LOG_MAX_LINES - self.LOG_TRIM_LINES
+                self.output_log.delete('1.0', f'{line_count - keep}.0')
+            if follow:
+                self.output_log.yview_moveto(1.0)
+        
+        self.root.after(self.LOG_FLUSH_MS, self._drain_log_queue)
     
     def copy_log_to_clipboard(self):
         """Copy all log content to clipboard"""
@@ -593,19 +842,53 @@ Features:
             return
         
         if messagebox.askyesno("Confirm", "Are you sure you want to clear the database? This will delete all indexed data."):
+            # A Sled database can hold many segment files; delete them without
+            # freezing the window, and only one clear at a time
+            self.clear_button.config(state='disabled')
+            self.status_var.set("Clearing database...")
+            threading.Thread(target=self._clear_database_worker, args=(db_path,), daemon=True).start()
+    
+    def _clear_database_worker(self, db_path):
+        """Delete the database in a background thread and report back on the Tk thread"""
+        import shutil
+        
+        # Release the database first; like indexing, this waits for any API
+        # request in flight and so stays off the Tk thread
+        self.api_client().suspend(self.SUSPEND_CLEARING)
+        try:
+            # One stat tells whether there is anything to delete and what it is
             try:
-                if os.path.exists(db_path):
-                    if os.path.isdir(db_path):
-                        # For Sled databases, remove the entire directory
-                        import shutil
-                        shutil.rmtree(db_path)
-                    else:
-                        # For files (legacy), just remove the file
-                        os.remove(db_path)
-                self.log_output(f"Database cleared: {db_path}")
-                messagebox.showinfo("Success", "Database cleared successfully")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to clear database: {str(e)}")
+                st = os.stat(db_path)
+            except FileNotFoundError:
+                st = None
+            if st is None:
+                pass
+            elif stat.S_ISDIR(st.st_mode):
+                # For Sled databases, remove the entire directory
+                shutil.rmtree(db_path)
+            else:
+                # For files (legacy), just remove the file
+                os.remove(db_path)
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        finally:
+            # Suspends nest, so a clear during indexing leaves the client
+            # suspended until the indexer is done as well
+            self.api_client().resume(self.SUSPEND_CLEARING)
+        self.root.after(0, self._database_cleared, db_path, error)
+    
+    def _database_cleared(self, db_path, error):
+        """Report the outcome of clear_database()"""
+        self.clear_button.config(state='normal')
+        self.status_var.set("Ready")
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to clear database: {str(error)}")
+            return
+        self.invalidate_api_cache()
+        self.log_output(f"Database cleared: {db_path}")
+        messagebox.showinfo("Success", "Database cleared successfully")
     
     def refresh_database_info(self):
         """Refresh database information"""
@@ -615,77 +898,207 @@ Features:
             self.results_tree.delete(*self.results_tree.get_children())
             return
         
-        # Check if database exists (Sled databases are directories)
-        if not os.path.exists(db_path):
-            self.db_info_var.set("Database not found")
+        error = self.sled_database_error(db_path)
+        if error:
+            self.db_info_var.set(error)
             self.results_tree.delete(*self.results_tree.get_children())
             return
         
-        # For Sled, check if it's a directory with the expected files
-        if os.path.isdir(db_path):
-            if not os.path.exists(os.path.join(db_path, 'db')):
-                self.db_info_var.set("Invalid Sled database (missing db file)")
-                self.results_tree.delete(*self.results_tree.get_children())
-                return
+        # The CLI call can take a while; run it off the Tk event loop
+        self.db_info_var.set("Loading...")
+        threading.Thread(target=self._load_database_info_worker, args=(db_path,), daemon=True).start()
+    
+    def _load_database_info_worker(self, db_path):
+        """Summarize db_path in a background thread and show it on the Tk thread"""
+        try:
+            summary = self.summarize_database(db_path)
+        except Exception as e:
+            self.root.after(0, self._apply_database_info, db_path, None, e)
         else:
-            # If it's a file, it might be an old SQLite database
-            self.db_info_var.set("Database appears to be SQLite format (not supported)")
-            self.results_tree.delete(*self.results_tree.get_children())
+            self.root.after(0, self._apply_database_info, db_path, summary, None)
+    
+    def _apply_database_info(self, db_path, summary, error):
+        """Show a database summary unless the user has since picked another database"""
+        if db_path != self.viewer_db_var.get():
+            return
+        if error is not None:
+            self.db_info_var.set(f"Error reading database: {str(error)}")
             return
         
         try:
-            # Use CLI API to get stats
-            result = subprocess.run([
-                'cargo', 'run', '--package', 'symgraph-cli', '--', 
-                'api', 'stats', '--db', db_path
-            ], capture_output=True, text=True, cwd='d:\\work\\Projects\\symgraph')
+            stats, totals, top_files = summary
+            file_count = stats.get('files', 0)
+            symbol_count = stats.get('symbols', 0)
+            edge_count = stats.get('edges', 0)
             
-            if result.returncode == 0:
-                stats = json.loads(result.stdout)
-                file_count = stats.get('files', 0)
-                symbol_count = stats.get('symbols', 0)
-                edge_count = stats.get('edges', 0)
-                
-                self.db_info_var.set(f"Files: {file_count}, Symbols: {symbol_count}, Edges: {edge_count}")
-                
-                # Get files using CLI API
-                files_result = subprocess.run([
-                    'cargo', 'run', '--package', 'symgraph-cli', '--', 
-                    'api', 'files', '--db', db_path
-                ], capture_output=True, text=True, cwd='d:\\work\\Projects\\symgraph')
-                
-                # Populate tree view
+            self.db_info_var.set(f"Files: {file_count}, Symbols: {symbol_count}, Edges: {edge_count}")
+            
+            # Pre-format every row so the insert loop below is only Tcl calls
+            rows = []
+            for category in sorted(totals):
+                # Add files in this category (limit to 10 for performance)
+                children = []
+                for symbol_count, _, file_info in sorted(top_files[category], reverse=True):
+                    file_path = file_info.get('path', '')
+                    file_name = os.path.basename(file_path)
+                    children.append((file_name, ('File', file_name, file_path, symbol_count)))
+                total = totals[category]
+                rows.append((f"{category} ({total})", ('Category', category, '', total), children))
+            
+            # Take the tree out of the layout while clearing and refilling it
+            # so it is laid out once at the end instead of as rows change
+            self.results_tree.pack_forget()
+            try:
                 self.results_tree.delete(*self.results_tree.get_children())
-                
-                if files_result.returncode == 0:
-                    files = json.loads(files_result.stdout)
-                    
-                    # Group files by category
-                    categories = {}
-                    for file_info in files:
-                        category = file_info.get('category', 'unknown')
-                        if category not in categories:
-                            categories[category] = []
-                        categories[category].append(file_info)
-                    
-                    # Add categories to tree
-                    for category, files_list in categories.items():
-                        category_node = self.results_tree.insert('', 'end', text=f"{category} ({len(files_list)})", values=('Category', category, '', len(files_list)))
-                        
-                        # Add files in this category (limit to 10 for performance)
-                        for file_info in sorted(files_list, key=lambda x: x.get('symbol_count', 0), reverse=True)[:10]:
-                            file_path = file_info.get('path', '')
-                            symbol_count = file_info.get('symbol_count', 0)
-                            self.results_tree.insert(category_node, 'end', text=os.path.basename(file_path), 
-                                                   values=('File', os.path.basename(file_path), file_path, symbol_count))
-                else:
-                    self.db_info_var.set(f"Error getting files: {files_result.stderr}")
-            else:
-                self.db_info_var.set(f"Error reading database: {result.stderr}")
+                insert = self.results_tree.insert
+                for text, values, children in rows:
+                    category_node = insert('', 'end', text=text, values=values)
+                    for child_text, child_values in children:
+                        insert(category_node, 'end', text=child_text, values=child_values)
+            finally:
+                self.results_tree.pack(fill='both', expand=True, before=self.results_scrollbar)
             
         except Exception as e:
             self.db_info_var.set(f"Error reading database: {str(e)}")
     
+    def summarize_database(self, db_path):
+        """Return (stats, category totals, top files per category) for db_path
+        
+        Shared by the viewer tab and the statistics dialog, and cached with
+        the CLI results so neither recounts what the other already has.
+        """
+        key = ('summary', db_path)
+        stamp = self.database_stamp(db_path)
+        cached = self._api_cache.get(key)
+        if stamp and cached and cached[0] == stamp:
+            return cached[1]
+        
+        # Stats and files come from a single CLI call
+        overview = self.call_cli_api('overview', db_path)
+        
+        # One pass over the files yields each category's total and its ten
+        # files with the most symbols, without sorting the whole list.
+        # The CLI reports a missing category as '', so fold that into 'unknown'
+        totals = Counter()
+        top_files = defaultdict(list)
+        for index, file_info in enumerate(overview.get('files', [])):
+            category = file_info.get('category') or 'unknown'
+            totals[category] += 1
+            # -index keeps the earlier file first among equal symbol counts
+            entry = (file_info.get('symbol_count', 0), -index, file_info)
+            heap = top_files[category]
+            if len(heap) < 10:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
+        
+        summary = (overview.get('stats', {}), totals, top_files)
+        self._api_cache[key] = (stamp, summary)
+        return summary
+    
+    def reload_database_info(self):
+        """Drop cached CLI results and refresh database information"""
+        self.invalidate_api_cache()
+        self.refresh_database_info()
+    
+    def call_cli_api(self, endpoint, db_path):
+        """Return the parsed JSON output of 'symgraph-cli api <endpoint>' for db_path
+        
+        Results are cached per database while its 'db' file is unchanged (or
+        until invalidate_api_cache() is called), so switching tabs or
+        reopening statistics doesn't rerun the CLI.
+        Raises RuntimeError with the CLI's error if the command fails, or
+        with the reason the database is unavailable while it is being
+        indexed or cleared.
+        """
+        from symgraph_client import ServerError
+        
+        key = (endpoint, db_path)
+        stamp = self.database_stamp(db_path)
+        cached = self._api_cache.get(key)
+        if stamp and cached and cached[0] == stamp:
+            return cached[1]
+        
+        try:
+            data = self.api_client().call(endpoint, db_path)
+        except ServerError:
+            # No api-serve, e.g. a binary built before it existed: fall back
+            # to a one-off process, which also reports any error. Its other
+            # errors are final, a one-off process couldn't open the database
+            # the server or the indexer holds
+            data = None
+        if data is not None:
+            self._api_cache[key] = (stamp, data)
+            return data
+        
+        # Read stdout as bytes: json.loads parses UTF-8 directly, so the
+        # output isn't first decoded into a str of the same size
+        result = subprocess.run(self.cli_command() + ['api', endpoint, '--db', db_path],
+                                capture_output=True, cwd=_REPO_ROOT)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode(errors='replace'))
+        
+        data = json.loads(result.stdout)
+        self._api_cache[key] = (stamp, data)
+        return data
+    
+    def api_client(self):
+        """Return the client for the shared 'symgraph-cli api-serve' process
+        
+        The process keeps the database open between the GUI's and the web
+        viewer's API calls; it is started on first use.
+        """
+        return self._api_client
+    
+    def cli_command(self):
+        """Return the command prefix that runs symgraph-cli
+        
+        Runs the binary cargo has already built (release or debug, whichever
+        is newer) rather than paying for 'cargo run' and its dependency check
+        on every call; until one exists 'cargo run' is used, which builds it.
+        The lookup is two stats and is redone on every call, so a binary
+        rebuilt while the GUI is open is picked up.
+        """
+        from symgraph_client import CARGO_RUN_COMMAND, find_cli_binary
+        binary = find_cli_binary(_REPO_ROOT)
+        if binary is None:
+            return list(CARGO_RUN_COMMAND)
+        return [binary]
+    
+    @staticmethod
+    def sled_database_error(db_path):
+        """Return why db_path is not a usable Sled database, or None if it is"""
+        # Sled databases are directories holding a 'db' file; finding that
+        # file settles the common case with a single stat
+        try:
+            os.stat(os.path.join(db_path, 'db'))
+            return None
+        except OSError:
+            pass
+        
+        try:
+            st = os.stat(db_path)
+        except OSError:
+            return "Database not found"
+        if stat.S_ISDIR(st.st_mode):
+            return "Invalid Sled database (missing db file)"
+        # If it's a file, it might be an old SQLite database
+        return "Database appears to be SQLite format (not supported)"
+    
+    @staticmethod
+    def database_stamp(db_path):
+        """Return (mtime_ns, size) of the Sled 'db' file, or None if it is missing"""
+        # sled rewrites its 'db' file whenever the index changes
+        try:
+            st = os.stat(os.path.join(db_path, 'db'))
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def invalidate_api_cache(self):
+        """Forget cached CLI results, e.g. after the database was rewritten"""
+        self._api_cache.clear()
+    
     def open_web_viewer(self):
         """Open web viewer"""
         db_path = self.current_db_path or self.viewer_db_var.get()
@@ -693,229 +1106,75 @@ Features:
             messagebox.showerror("Error", "Please select a database path")
             return
         
-        # Check if database exists (Sled databases are directories)
-        if not os.path.exists(db_path):
-            messagebox.showerror("Error", "Database not found")
+        error = self.sled_database_error(db_path)
+        if error:
+            messagebox.showerror("Error", error)
             return
         
-        # For Sled, check if it's a valid database directory
-        if os.path.isdir(db_path):
-            if not os.path.exists(os.path.join(db_path, 'db')):
-                messagebox.showerror("Error", "Invalid Sled database (missing db file)")
-                return
-        else:
-            messagebox.showerror("Error", "Database appears to be SQLite format (not supported)")
+        # Imported here rather than at startup: it is only needed once the
+        # user asks for the viewer
+        import webbrowser
+        
+        # The server outlives each click: if it already serves this database
+        # just point the browser at it again
+        if self.is_web_server_running(db_path):
+            webbrowser.open('http://localhost:5000')
+            self.status_var.set("Web viewer opened at http://localhost:5000")
             return
         
         try:
             # Start Flask web server
             self.start_web_server(db_path)
             
-            # Wait for server to start and check if it's ready
-            server_ready = False
-            for attempt in range(10):  # Try for up to 10 seconds
-                try:
-                    time.sleep(1)  # Wait 1 second between attempts
-                    response = requests.get('http://localhost:5000', timeout=2)
-                    if response.status_code == 200:
-                        server_ready = True
-                        break
-                except (requests.exceptions.RequestException, requests.exceptions.ConnectionError):
-                    continue
-            
-            if server_ready:
-                # Open browser
-                webbrowser.open('http://localhost:5000')
-                self.status_var.set("Web viewer opened at http://localhost:5000")
-            else:
-                # Check if the server process is still running
-                if self.web_server_process and self.web_server_process.poll() is not None:
-                    stdout, stderr = self.web_server_process.communicate()
-                    error_msg = f"Server process terminated. Error: {stderr.decode() if stderr else 'Unknown error'}"
-                else:
-                    error_msg = "Server did not respond within 10 seconds. Please check if port 5000 is available."
-                
-                messagebox.showerror("Error", f"Failed to start web server.\n{error_msg}")
-                self.status_var.set("Failed to start web server")
+            # Open browser
+            webbrowser.open('http://localhost:5000')
+            self.status_var.set("Web viewer opened at http://localhost:5000")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open web viewer: {str(e)}")
     
+    def is_web_server_running(self, db_path):
+        """Check whether the web server is up and serving db_path"""
+        return self.web_server is not None and self.web_server_db == db_path
+    
     def start_web_server(self, db_path):
-        """Start Flask web server"""
-        if self.web_server_process:
-            self.web_server_process.terminate()
+        """Serve db_path with the viewer's Flask app on a background thread
         
-        # Simple Flask app content
-        app_content = f'''
-from flask import Flask, request, jsonify, send_from_directory
-import subprocess
-import json
-import os
-
-app = Flask(__name__)
-
-def call_rust_api(endpoint, db_path, search=None):
-    """Call Rust symgraph CLI to get data"""
-    try:
-        cmd = ['cargo', 'run', '--package', 'symgraph-cli', '--', 'api', endpoint, '--db', db_path]
-        if search:
-            cmd.extend(['--search', search])
-        
-        result = subprocess.run(
-            cmd, 
-            capture_output=True, 
-            text=True, 
-            cwd='d:\\\\work\\\\Projects\\\\symgraph'
-        )
+        A server that is already running is pointed at db_path rather than
+        restarted.
+        """
+        if self.web_server is not None:
+            # The app reads DB_PATH on every request and keys its response
+            # cache by it, so switching databases needs no new app
+            self.web_server.app.config['DB_PATH'] = db_path
+            self.web_server_db = db_path
+            return
         
-        if result.returncode == 0:
-            return json.loads(result.stdout)
-        else:
-            return {{"error": result.stderr, "code": result.returncode}}
-    except Exception as e:
-        return {{"error": str(e), "code": 500}}
-
-@app.route('/')
-def index():
-    # Serve the static HTML file
-    try:
-        with open('static/index.html', 'r', encoding='utf-8') as f:
-            return f.read()
-    except FileNotFoundError:
-        return """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Error</title>
-        </head>
-        <body>
-            <h1>Error</h1>
-            <p>Static files not found. Please ensure the static directory exists with index.html</p>
-        </body>
-        </html>
-        """, 404
-
-@app.route('/static/<path:filename>')
-def serve_static(filename):
-    """Serve static files"""
-    try:
-        return send_from_directory('static', filename)
-    except FileNotFoundError:
-        return "File not found", 404
-
-@app.route('/api/stats')
-def get_stats():
-    data = call_rust_api('stats', r'{db_path}')
-    if 'error' in data:
-        return jsonify(data), 500
-    return jsonify(data)
-
-@app.route('/api/files')
-def get_files():
-    search = request.args.get('search', '')
-    data = call_rust_api('files', r'{db_path}', search if search else None)
-    if 'error' in data:
-        return jsonify(data), 500
-    return jsonify(data)
-
-@app.route('/api/symbols')
-def get_symbols():
-    search = request.args.get('search', '')
-    data = call_rust_api('symbols', r'{db_path}', search if search else None)
-    if 'error' in data:
-        return jsonify(data), 500
-    return jsonify(data)
-
-@app.route('/api/scip/documents')
-def get_scip_documents():
-    # For SCIP documents, we'll use files endpoint and filter by SCIP-related categories
-    data = call_rust_api('files', r'{db_path}')
-    if 'error' in data:
-        return jsonify(data), 500
-    
-    # Filter files that might be SCIP-related (category containing 'scip' or similar)
-    scip_files = [
-        {{
-            'relative_path': f.get('path', ''),
-            'language': f.get('language', f.get('lang', '')),
-            'category': f.get('category', ''),
-            'purpose': f.get('purpose', ''),
-            'symbol_count': f.get('symbol_count', 0)
-        }}
-        for f in data 
-        if 'scip' in f.get('category', '').lower() or 'scip' in f.get('purpose', '').lower()
-    ]
-    
-    return jsonify(scip_files)
-
-@app.route('/api/scip/symbols')
-def get_scip_symbols():
-    search = request.args.get('search', '')
-    data = call_rust_api('symbols', r'{db_path}', search if search else None)
-    if 'error' in data:
-        return jsonify(data), 500
-    
-    # Transform symbols to SCIP format
-    scip_symbols = [
-        {{
-            'display_name': s.get('name', ''),
-            'symbol_kind': s.get('kind', ''),
-            'symbol': s.get('name', ''),
-            'file_path': s.get('file_id', ''),
-            'category': 'scip'
-        }}
-        for s in data
-    ]
-    
-    return jsonify(scip_symbols)
-
-if __name__ == '__main__':
-    app.run(debug=False, port=5000)
-'''
-        
-        # Write the Flask app to a temporary file
-        temp_dir = tempfile.mkdtemp()
-        app_file = os.path.join(temp_dir, 'symgraph_viewer.py')
-        with open(app_file, 'w') as f:
-            f.write(app_content)
-        
-        # Copy static files to temp directory
-        static_dir = os.path.join(temp_dir, 'static')
-        os.makedirs(static_dir, exist_ok=True)
-        
-        # Get the path to our static files
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        source_static = os.path.join(current_dir, '..', 'static')
-        
-        # Copy all static files
-        if os.path.exists(source_static):
-            for item in os.listdir(source_static):
-                source_item = os.path.join(source_static, item)
-                dest_item = os.path.join(static_dir, item)
-                if os.path.isdir(source_item):
-                    shutil.copytree(source_item, dest_item, dirs_exist_ok=True)
-                else:
-                    shutil.copy2(source_item, dest_item)
+        # Imported here so Flask is only loaded once the viewer is used
+        from werkzeug.serving import make_server
+        from symgraph_viewer import create_app
         
-        # Start the Flask server
         try:
-            self.web_server_process = subprocess.Popen(
-                ['python', app_file],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=temp_dir
-            )
-            
-            # Check if process started successfully
-            time.sleep(0.5)
-            if self.web_server_process.poll() is not None:
-                # Process has already terminated
-                stdout, stderr = self.web_server_process.communicate()
-                raise Exception(f"Flask server failed to start: {stderr.decode() if stderr else 'Unknown error'}")
-                
+            # make_server binds the port before returning, so the viewer
+            # can be opened as soon as this succeeds. Each request gets its
+            # own thread, so the page's parallel API calls don't queue up
+            # behind one another's CLI runs
+            app = create_app(db_path, api_client=self.api_client())
+            server = make_server('127.0.0.1', 5000, app, threaded=True)
         except Exception as e:
             raise Exception(f"Failed to start Flask server: {str(e)}")
+        
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.web_server = server
+        self.web_server_db = db_path
+    
+    def stop_web_server(self):
+        """Shut the web server down if it is running"""
+        if self.web_server:
+            self.web_server.shutdown()
+            self.web_server.server_close()
+            self.web_server = None
+        self.web_server_db = None
     
     def show_statistics(self):
         """Show detailed statistics"""
@@ -924,64 +1183,57 @@ if __name__ == '__main__':
             messagebox.showerror("Error", "Please select a database path")
             return
         
-        # Check if database exists (Sled databases are directories)
-        if not os.path.exists(db_path):
-            messagebox.showerror("Error", "Database not found")
+        error = self.sled_database_error(db_path)
+        if error:
+            messagebox.showerror("Error", error)
             return
         
-        # For Sled, check if it's a valid database directory
-        if os.path.isdir(db_path):
-            if not os.path.exists(os.path.join(db_path, 'db')):
-                messagebox.showerror("Error", "Invalid Sled database (missing db file)")
-                return
+        # Same summary the viewer tab shows, usually already cached; when it
+        # isn't, the CLI call runs off the Tk event loop
+        self.status_var.set("Loading statistics...")
+        threading.Thread(target=self._load_statistics_worker, args=(db_path,), daemon=True).start()
+    
+    def _load_statistics_worker(self, db_path):
+        """Summarize db_path in a background thread and show the dialog on the Tk thread"""
+        try:
+            summary = self.summarize_database(db_path)
+        except Exception as e:
+            self.root.after(0, self._show_statistics_dialog, None, e)
         else:
-            messagebox.showerror("Error", "Database appears to be SQLite format (not supported)")
+            self.root.after(0, self._show_statistics_dialog, summary, None)
+    
+    def _show_statistics_dialog(self, summary, error):
+        """Show the statistics built by _load_statistics_worker()"""
+        self.status_var.set("Ready")
+        if isinstance(error, RuntimeError):
+            messagebox.showerror("Error", f"Failed to get statistics: {error}")
+            return
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to show statistics: {str(error)}")
             return
         
         try:
-            # Use CLI API to get stats
-            result = subprocess.run([
-                'cargo', 'run', '--package', 'symgraph-cli', '--', 
-                'api', 'stats', '--db', db_path
-            ], capture_output=True, text=True, cwd='d:\\work\\Projects\\symgraph')
+            stats, categories, _ = summary
+            file_count = stats.get('files', 0)
+            symbol_count = stats.get('symbols', 0)
+            edge_count = stats.get('edges', 0)
             
-            if result.returncode == 0:
-                stats = json.loads(result.stdout)
-                file_count = stats.get('files', 0)
-                symbol_count = stats.get('symbols', 0)
-                edge_count = stats.get('edges', 0)
-                
-                # Get files using CLI API for categories
-                files_result = subprocess.run([
-                    'cargo', 'run', '--package', 'symgraph-cli', '--', 
-                    'api', 'files', '--db', db_path
-                ], capture_output=True, text=True, cwd='d:\\work\\Projects\\symgraph')
-                
-                # Get file categories
-                categories = {}
-                if files_result.returncode == 0:
-                    files = json.loads(files_result.stdout)
-                    for file_info in files:
-                        category = file_info.get('category', 'unknown')
-                        categories[category] = categories.get(category, 0) + 1
-                
-                # Create statistics message
-                stats_text = f"""
-Database Statistics
-==================
-
-Files: {file_count}
-Symbols: {symbol_count}  
-Edges: {edge_count}
-
-File Categories:
-"""
-                for category, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
-                    stats_text += f"  {category}: {count}\n"
-                
-                messagebox.showinfo("Database Statistics", stats_text)
-            else:
-                messagebox.showerror("Error", f"Failed to get statistics: {result.stderr}")
+            # Create statistics message
+            lines = [
+                "",
+                "Database Statistics",
+                "==================",
+                "",
+                f"Files: {file_count}",
+                f"Symbols: {symbol_count}  ",
+                f"Edges: {edge_count}",
+                "",
+                "File Categories:",
+            ]
+            lines.extend(f"  {category}: {count}" for category, count in categories.most_common())
+            lines.append("")
+            
+            messagebox.showinfo("Database Statistics", "\n".join(lines))
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to show statistics: {str(e)}")
@@ -989,12 +1241,7 @@ File Categories:
     def clear_settings(self):
         """Clear all settings"""
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all settings?"):
-            self.settings = {
-                'last_project_dir': '',
-                'last_db_path': '',
-                'window_geometry': '',
-                'auto_open_viewer': True
-            }
+            self.settings = dict(self.DEFAULT_SETTINGS)
             self.save_settings()
             messagebox.showinfo("Success", "Settings cleared successfully")
 
@@ -1004,8 +1251,8 @@ def main():
     
     def on_closing():
         app.save_settings()
-        if app.web_server_process:
-            app.web_server_process.terminate()
+        app.stop_web_server()
+        app.api_client().close()
         root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
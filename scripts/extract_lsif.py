@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
-import json, urllib.parse, sys
+import json, re, urllib.parse, sys
+# file:// URI -> path; the '/' before a Windows drive letter is dropped
+FILE_URI=re.compile(r'file://(?:/(?=[A-Za-z]:))?(.*)')
 infile='compile_commands.json'
 out_json='sources.json'
 out_txt='sources.txt'
 uris=[]
 try:
-    with open(infile, 'r', encoding='utf-8') as f:
+    # Read raw bytes and only parse lines that can be document vertices;
+    # json.loads decodes the UTF-8 itself
+    with open(infile, 'rb', buffering=1024*1024) as f:
         for line in f:
-            line=line.strip()
-            if not line: continue
+            if b'"document"' not in line: continue
             try:
                 obj=json.loads(line)
             except Exception:
@@ -16,18 +19,21 @@ try:
             if obj.get('type')=='vertex' and obj.get('label')=='document':
                 uri=obj.get('uri')
                 if uri:
-                    if uri.startswith('file://'):
-                        u=uri[len('file://'):]
-                        if u.startswith('/') and len(u)>=3 and u[2]==':':
-                            u=u[1:]
-                        path=urllib.parse.unquote(u)
+                    m=FILE_URI.match(uri)
+                    if m:
+                        path=m.group(1)
+                        # Most paths have no escapes; skip unquote for those
+                        if '%' in path:
+                            path=urllib.parse.unquote(path)
                     else:
                         path=uri
                     uris.append(path)
+    # Build each file in memory and write it in one call: json.dump would
+    # issue a write per encoder chunk
     with open(out_json,'w',encoding='utf-8') as f:
-        json.dump(uris,f,indent=2,ensure_ascii=False)
+        f.write(json.dumps(uris,indent=2,ensure_ascii=False))
     with open(out_txt,'w',encoding='utf-8') as f:
-        for p in uris: f.write(p+"\n")
+        f.write("\n".join(uris)+"\n" if uris else "")
     print(f"written {len(uris)} sources to {out_json} and {out_txt}")
 except FileNotFoundError:
     print(f"Input file {infile} not found", file=sys.stderr)
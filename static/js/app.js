@@ -27,9 +27,12 @@ function loadFiles() {
     fetch('/api/files')
         .then(response => response.json())
         .then(data => {
+            // Files arrive as {columns, rows}; look each column's position up once
+            const col = {};
+            data.columns.forEach((name, index) => col[name] = index);
             let html = '<table><tr><th>Path</th><th>Language</th><th>Category</th><th>Symbols</th></tr>';
-            data.forEach(file => {
-                html += `<tr><td>${file.path}</td><td>${file.lang}</td><td>${file.category}</td><td>${file.symbol_count}</td></tr>`;
+            data.rows.forEach(row => {
+                html += `<tr><td>${row[col.path]}</td><td>${row[col.language]}</td><td>${row[col.category]}</td><td>${row[col.symbol_count]}</td></tr>`;
             });
             html += '</table>';
             document.getElementById('files').innerHTML = html;
@@ -5,15 +5,29 @@ Tests the core functionality of detecting different project types
 based on indicator files and source file extensions.
 """
 
+import functools
 import unittest
 import tempfile
 import os
-from pathlib import Path
 import sys
 
 # Add parent directory to path to import the GUI module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+
+# Build output, dependency and cache directories, never counted as sources
+_SKIP_DIRS = frozenset({'build', 'target', 'node_modules', '__pycache__', '.git',
+                        '.venv', 'venv', 'dist'})
+
+
+@functools.lru_cache(maxsize=None)
+def _split_indicators(indicators: tuple) -> tuple:
+    """Split indicators into exact file names and '*<suffix>' suffixes"""
+    exact = frozenset(i for i in indicators if not i.startswith('*'))
+    suffixes = tuple(i[1:] for i in indicators if i.startswith('*'))
+    return exact, suffixes
+
+
 # Import the project configuration from enhanced_symgraph_gui
 # We'll test the detection logic without requiring tkinter
 class MockEnhancedGUI:
@@ -45,50 +59,66 @@ class MockEnhancedGUI:
     
     def is_project_type(self, path: str, config: dict) -> bool:
         """Check if directory matches project type"""
-        if not os.path.exists(path):
+        try:
+            with os.scandir(path) as it:
+                files = {entry.name for entry in it}
+        except OSError:
             return False
-            
-        files = os.listdir(path)
         
-        for indicator in config['indicators']:
-            if indicator.startswith('*'):
-                ext = indicator[1:]
-                if any(f.endswith(ext) for f in files):
-                    return True
-            else:
-                if indicator in files:
-                    return True
-        return False
+        exact, suffixes = _split_indicators(tuple(config['indicators']))
+        if not files.isdisjoint(exact):
+            return True
+        return any(f.endswith(suffixes) for f in files)
     
     def count_source_files(self, path: str, extensions: list) -> int:
         """Count source files in directory"""
-        count = 0
-        for root, dirs, files in os.walk(path):
-            # Skip common build/cache directories
-            dirs[:] = [d for d in dirs if d not in ['build', 'target', 'node_modules', '__pycache__', '.git']]
-            count += sum(1 for f in files if any(f.endswith(ext) for ext in extensions))
-        return count
+        exts = frozenset(extensions)
+        
+        def walk(directory):
+            # DirEntry.is_dir() comes from the directory listing itself, so
+            # no file is stat()ed, and each extension check is one set lookup.
+            # Symlinked directories are not entered, so links can't loop
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIP_DIRS:
+                            yield from walk(entry.path)
+                    elif os.path.splitext(entry.name)[1] in exts:
+                        yield 1
+        
+        return sum(walk(path))
 
 
 class TestProjectTypeDetection(unittest.TestCase):
     """Test suite for project type detection"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one base directory shared by every test in the class"""
+        cls.base_dir = tempfile.mkdtemp()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared base directory"""
+        import shutil
+        shutil.rmtree(cls.base_dir, ignore_errors=True)
+    
     def setUp(self):
         """Set up test fixtures"""
         self.gui = MockEnhancedGUI()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def tearDown(self):
-        """Clean up test fixtures"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        # Each test still gets a directory of its own
+        self.temp_dir = os.path.join(self.base_dir, self._testMethodName)
+        os.makedirs(self.temp_dir)
     
     def create_test_project(self, files: list) -> str:
         """Helper to create a test project with specified files"""
-        for file_path in files:
-            full_path = os.path.join(self.temp_dir, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            Path(full_path).touch()
+        paths = [os.path.join(self.temp_dir, file_path) for file_path in files]
+        # Create each subdirectory once, however many files it holds
+        for parent in {os.path.dirname(p) for p in paths} - {self.temp_dir}:
+            os.makedirs(parent, exist_ok=True)
+        # An empty file is all that's needed; open/close skips touch()'s utime
+        for full_path in paths:
+            open(full_path, 'wb').close()
         return self.temp_dir
     
     # C++ Project Tests
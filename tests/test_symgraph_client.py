@@ -0,0 +1,205 @@
+"""
+Unit tests for the symgraph-cli api-serve client.
+
+A small Python script stands in for 'symgraph-cli api-serve' and speaks
+the same line protocol: one JSON request per line in, a status line and a
+JSON body line out.
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# The client lives next to the GUI
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'gui'))
+
+from symgraph_client import ApiError, RustClient, ServerError, SuspendedError
+
+
+FAKE_SERVER = r'''
+import json, os, sys, time
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if request['endpoint'] == 'crash':
+        sys.stderr.write('crashed on purpose\n')
+        sys.exit(3)
+    if request['endpoint'] == 'slow':
+        time.sleep(0.3)
+    if 'fail' in request['db']:
+        sys.stdout.write('error\n' + json.dumps('cannot read ' + request['db']) + '\n')
+    else:
+        request['pid'] = os.getpid()
+        sys.stdout.write('ok\n' + json.dumps(request) + '\n')
+    sys.stdout.flush()
+'''
+
+
+class FakeServerTestCase(unittest.TestCase):
+    """Clients talking to the fake api-serve"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        script = os.path.join(cls.temp_dir, 'fake_api_serve.py')
+        with open(script, 'w') as f:
+            f.write(FAKE_SERVER)
+        # The client appends 'api-serve', which the script ignores
+        cls.cli_command = [sys.executable, script]
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def make_client(self, **kwargs):
+        client = RustClient(self.cli_command, self.temp_dir, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+
+class TestRustClient(FakeServerTestCase):
+    """Test the line protocol, error handling and suspend/resume"""
+
+    def test_request_round_trip(self):
+        """Each request is one JSON line; the body line comes back as is"""
+        client = self.make_client()
+        body = client.request('symbols', 'test.db', search='main', after='id-1', limit=10)
+        self.assertTrue(body.endswith(b'\n'))
+        reply = json.loads(body)
+        self.assertEqual(reply['endpoint'], 'symbols')
+        self.assertEqual(reply['db'], 'test.db')
+        self.assertEqual(reply['search'], 'main')
+        self.assertEqual(reply['after'], 'id-1')
+        self.assertEqual(reply['limit'], 10)
+
+    def test_process_is_reused(self):
+        """Requests share one process"""
+        client = self.make_client()
+        first = client.call('stats', 'test.db')
+        second = client.call('files', 'test.db')
+        self.assertEqual(first['pid'], second['pid'])
+
+    def test_error_reply_raises_api_error(self):
+        """An error status raises ApiError with the server's message"""
+        client = self.make_client()
+        with self.assertRaises(ApiError) as cm:
+            client.request('stats', 'fail.db')
+        self.assertEqual(str(cm.exception), 'cannot read fail.db')
+        # The process is still serving
+        self.assertEqual(client.call('stats', 'test.db')['endpoint'], 'stats')
+
+    def test_exit_raises_server_error_and_restarts(self):
+        """A process that exits fails its request with its stderr; the next starts afresh"""
+        client = self.make_client()
+        pid = client.call('stats', 'test.db')['pid']
+        with self.assertRaises(ServerError) as cm:
+            client.request('crash', 'test.db')
+        self.assertIn('crashed on purpose', str(cm.exception))
+        self.assertNotEqual(client.call('stats', 'test.db')['pid'], pid)
+
+    def test_missing_binary_raises_server_error(self):
+        """A command that can't be started raises ServerError"""
+        client = RustClient([os.path.join(self.temp_dir, 'missing-cli')], self.temp_dir)
+        with self.assertRaises(ServerError):
+            client.request('stats', 'test.db')
+
+    def test_concurrent_requests_get_their_own_answers(self):
+        """Requests from several threads are answered in the order sent"""
+        client = self.make_client()
+        results = {}
+
+        def ask(n):
+            results[n] = client.call('symbols', 'test.db', search=str(n))['search']
+
+        threads = [threading.Thread(target=ask, args=(n,)) for n in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {n: str(n) for n in range(16)})
+
+    def test_suspend_refuses_requests_until_resume(self):
+        """A suspended client raises SuspendedError with the reason"""
+        client = self.make_client()
+        pid = client.call('stats', 'test.db')['pid']
+        client.suspend('Indexing in progress')
+        with self.assertRaises(SuspendedError) as cm:
+            client.request('stats', 'test.db')
+        self.assertEqual(str(cm.exception), 'Indexing in progress')
+        client.resume('Indexing in progress')
+        # The process was stopped to release the database
+        self.assertNotEqual(client.call('stats', 'test.db')['pid'], pid)
+
+    def test_suspends_nest(self):
+        """Requests stay refused until every suspend() is resumed"""
+        client = self.make_client()
+        client.suspend('Indexing in progress')
+        client.suspend('The database is being cleared')
+        client.resume('The database is being cleared')
+        with self.assertRaises(SuspendedError) as cm:
+            client.request('stats', 'test.db')
+        self.assertEqual(str(cm.exception), 'Indexing in progress')
+        client.resume('Indexing in progress')
+        self.assertEqual(client.call('stats', 'test.db')['endpoint'], 'stats')
+
+    def test_suspend_waits_for_request_in_flight(self):
+        """suspend() lets the request being served finish first"""
+        client = self.make_client()
+        client.call('stats', 'test.db')
+        results = []
+        thread = threading.Thread(target=lambda: results.append(client.call('slow', 'test.db')))
+        thread.start()
+        time.sleep(0.1)
+        client.suspend()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['endpoint'], 'slow')
+        thread.join()
+
+    def test_idle_process_is_stopped(self):
+        """The process exits after idle_timeout, releasing the database"""
+        client = self.make_client(idle_timeout=0.1)
+        pid = client.call('stats', 'test.db')['pid']
+        time.sleep(0.5)
+        self.assertIsNone(client._server)
+        self.assertNotEqual(client.call('stats', 'test.db')['pid'], pid)
+
+
+@unittest.skipUnless(importlib.util.find_spec('flask'), "Flask is not installed")
+class TestViewerApiClient(FakeServerTestCase):
+    """Test how the web viewer reports the client's errors"""
+
+    def get(self, client, db_path, url):
+        import symgraph_viewer
+        app = symgraph_viewer.create_app(db_path, api_client=client)
+        # Any one-off CLI run would fail the test rather than build the crate
+        app.config['CLI_COMMAND'] = [os.path.join(self.temp_dir, 'missing-cli')]
+        return app.test_client().get(url)
+
+    def test_answer_is_served(self):
+        response = self.get(self.make_client(), 'test.db', '/api/stats')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['endpoint'], 'stats')
+
+    def test_error_reply_is_passed_through(self):
+        """The server's error is reported, not a one-off CLI run's"""
+        response = self.get(self.make_client(), 'fail.db', '/api/stats')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.get_json()['error'], 'cannot read fail.db')
+
+    def test_suspended_client_answers_503(self):
+        """While indexing, requests get 503 with the reason"""
+        client = self.make_client()
+        client.suspend('Indexing in progress')
+        response = self.get(client, 'test.db', '/api/symbols?limit=5')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json()['error'], 'Indexing in progress')
+
+
+if __name__ == '__main__':
+    unittest.main()